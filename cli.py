@@ -50,7 +50,9 @@ Examples:
     )
 
     # Required arguments
-    parser.add_argument("input_file", help="Input .nessus file to process")
+    parser.add_argument(
+        "input_file", help="Input .nessus (or gzipped .nessus.gz) file to process"
+    )
 
     parser.add_argument("-o", "--output", help="Output file path")
 
@@ -99,12 +101,14 @@ Examples:
             print(f"Error: Input file '{args.input_file}' not found")
             sys.exit(1)
 
-        if not args.input_file.lower().endswith(".nessus"):
+        if not args.input_file.lower().endswith((".nessus", ".nessus.gz")):
             print("Warning: Input file doesn't have .nessus extension")
 
         # Set default output file if not provided
         if not args.output:
             base_name = Path(args.input_file).stem
+            if args.input_file.lower().endswith(".gz"):
+                base_name = Path(base_name).stem
             if args.summary:
                 args.output = f"{base_name}_summary.csv"
             else:
@@ -24,6 +24,112 @@ class STIGFinding:
     nist_controls: List[str]
 
 
+# Plugin ID to STIG mapping for common Nessus plugins. Built once at import;
+# STIGMapper instances take a shallow copy so per-instance additions stay local,
+# and copy entries and their lists on the way out so callers never share them.
+PLUGIN_TO_STIG = {
+    # Windows STIG mappings
+    "10863": {
+        "stig_id": "V-1112",
+        "rule_id": "SV-52844r1_rule",
+        "severity": "CAT II",
+        "group_title": "Undeletable Scheduled Tasks",
+        "rule_title": "Only administrators responsible for system can have the "
+        "Debug programs user right",
+        "cci_refs": ["CCI-002235"],
+        "nist_controls": ["AC-6(10)"],
+    },
+    "21643": {
+        "stig_id": "V-1114",
+        "rule_id": "SV-52847r2_rule",
+        "severity": "CAT II",
+        "group_title": "SMBv1 Protocol",
+        "rule_title": "The Windows SMB client must be configured to always perform "
+        "SMB packet signing",
+        "cci_refs": ["CCI-000366"],
+        "nist_controls": ["CM-6"],
+    },
+    # SSL/TLS STIG mappings
+    "20007": {
+        "stig_id": "V-68897",
+        "rule_id": "SV-83493r1_rule",
+        "severity": "CAT I",
+        "group_title": "SSL Version 2 and 3 Protocol Detection",
+        "rule_title": "SSL 2.0 and 3.0 must be disabled",
+        "cci_refs": ["CCI-001453"],
+        "nist_controls": ["AC-17(2)"],
+    },
+    "42873": {
+        "stig_id": "V-68903",
+        "rule_id": "SV-83499r2_rule",
+        "severity": "CAT II",
+        "group_title": "SSL Medium Strength Cipher Suites Supported",
+        "rule_title": "SSL/TLS must use FIPS 140-2 approved ciphers",
+        "cci_refs": ["CCI-001453"],
+        "nist_controls": ["AC-17(2)", "SC-13"],
+    },
+    # Apache STIG mappings
+    "11422": {
+        "stig_id": "V-2230",
+        "rule_id": "SV-32755r2_rule",
+        "severity": "CAT II",
+        "group_title": "Apache Version Detection",
+        "rule_title": "Apache server version must be hidden",
+        "cci_refs": ["CCI-000366"],
+        "nist_controls": ["CM-6"],
+    },
+    # Microsoft Patch Mappings
+    "66334": {
+        "stig_id": "V-92485",
+        "rule_id": "SV-102573r1_rule",
+        "severity": "CAT I",
+        "group_title": "MS15-034 Remote Code Execution",
+        "rule_title": "Security patches must be installed",
+        "cci_refs": ["CCI-000366"],
+        "nist_controls": ["SI-2"],
+    },
+    # Weak Password/Authentication
+    "10394": {
+        "stig_id": "V-1098",
+        "rule_id": "SV-52843r2_rule",
+        "severity": "CAT II",
+        "group_title": "Password Complexity Requirements",
+        "rule_title": "Passwords must meet complexity requirements",
+        "cci_refs": ["CCI-000192", "CCI-000193", "CCI-000194"],
+        "nist_controls": ["IA-5(1)"],
+    },
+    # Default Credentials
+    "11219": {
+        "stig_id": "V-15823",
+        "rule_id": "SV-16720r1_rule",
+        "severity": "CAT I",
+        "group_title": "Default Credentials",
+        "rule_title": "Default vendor passwords must be changed",
+        "cci_refs": ["CCI-000366"],
+        "nist_controls": ["IA-5(1)"],
+    },
+}
+
+# CVE to STIG mapping (sample mappings)
+CVE_TO_STIG = {
+    "CVE-2014-0160": {  # Heartbleed
+        "stig_id": "V-68897",
+        "severity": "CAT I",
+        "nist_controls": ["SC-8", "SC-8(1)"],
+    },
+    "CVE-2017-0144": {  # EternalBlue
+        "stig_id": "V-92485",
+        "severity": "CAT I",
+        "nist_controls": ["SI-2"],
+    },
+    "CVE-2021-44228": {  # Log4Shell
+        "stig_id": "V-252847",
+        "severity": "CAT I",
+        "nist_controls": ["SI-2", "SI-10"],
+    },
+}
+
+
 class STIGMapper:
     """Maps vulnerabilities to STIG requirements"""
 
@@ -32,108 +138,8 @@ class STIGMapper:
 
     def _initialize_mappings(self):
         """Initialize STIG mappings for common Nessus plugins"""
-        # Plugin ID to STIG mapping
-        self.plugin_to_stig = {
-            # Windows STIG mappings
-            "10863": {
-                "stig_id": "V-1112",
-                "rule_id": "SV-52844r1_rule",
-                "severity": "CAT II",
-                "group_title": "Undeletable Scheduled Tasks",
-                "rule_title": "Only administrators responsible for system can have the "
-                "Debug programs user right",
-                "cci_refs": ["CCI-002235"],
-                "nist_controls": ["AC-6(10)"],
-            },
-            "21643": {
-                "stig_id": "V-1114",
-                "rule_id": "SV-52847r2_rule",
-                "severity": "CAT II",
-                "group_title": "SMBv1 Protocol",
-                "rule_title": "The Windows SMB client must be configured to always perform "
-                "SMB packet signing",
-                "cci_refs": ["CCI-000366"],
-                "nist_controls": ["CM-6"],
-            },
-            # SSL/TLS STIG mappings
-            "20007": {
-                "stig_id": "V-68897",
-                "rule_id": "SV-83493r1_rule",
-                "severity": "CAT I",
-                "group_title": "SSL Version 2 and 3 Protocol Detection",
-                "rule_title": "SSL 2.0 and 3.0 must be disabled",
-                "cci_refs": ["CCI-001453"],
-                "nist_controls": ["AC-17(2)"],
-            },
-            "42873": {
-                "stig_id": "V-68903",
-                "rule_id": "SV-83499r2_rule",
-                "severity": "CAT II",
-                "group_title": "SSL Medium Strength Cipher Suites Supported",
-                "rule_title": "SSL/TLS must use FIPS 140-2 approved ciphers",
-                "cci_refs": ["CCI-001453"],
-                "nist_controls": ["AC-17(2)", "SC-13"],
-            },
-            # Apache STIG mappings
-            "11422": {
-                "stig_id": "V-2230",
-                "rule_id": "SV-32755r2_rule",
-                "severity": "CAT II",
-                "group_title": "Apache Version Detection",
-                "rule_title": "Apache server version must be hidden",
-                "cci_refs": ["CCI-000366"],
-                "nist_controls": ["CM-6"],
-            },
-            # Microsoft Patch Mappings
-            "66334": {
-                "stig_id": "V-92485",
-                "rule_id": "SV-102573r1_rule",
-                "severity": "CAT I",
-                "group_title": "MS15-034 Remote Code Execution",
-                "rule_title": "Security patches must be installed",
-                "cci_refs": ["CCI-000366"],
-                "nist_controls": ["SI-2"],
-            },
-            # Weak Password/Authentication
-            "10394": {
-                "stig_id": "V-1098",
-                "rule_id": "SV-52843r2_rule",
-                "severity": "CAT II",
-                "group_title": "Password Complexity Requirements",
-                "rule_title": "Passwords must meet complexity requirements",
-                "cci_refs": ["CCI-000192", "CCI-000193", "CCI-000194"],
-                "nist_controls": ["IA-5(1)"],
-            },
-            # Default Credentials
-            "11219": {
-                "stig_id": "V-15823",
-                "rule_id": "SV-16720r1_rule",
-                "severity": "CAT I",
-                "group_title": "Default Credentials",
-                "rule_title": "Default vendor passwords must be changed",
-                "cci_refs": ["CCI-000366"],
-                "nist_controls": ["IA-5(1)"],
-            },
-        }
-
-        # CVE to STIG mapping (sample mappings)
-        self.cve_to_stig = {
-            "CVE-2014-0160": {  # Heartbleed
-                "stig_id": "V-68897",
-                "severity": "CAT I",
-                "nist_controls": ["SC-8", "SC-8(1)"],
-            },
-            "CVE-2017-0144": {  # EternalBlue
-                "stig_id": "V-92485",
-                "severity": "CAT I",
-                "nist_controls": ["SI-2"],
-            },
-            "CVE-2021-44228": {  # Log4Shell
-                "stig_id": "V-252847",
-                "severity": "CAT I",
-                "nist_controls": ["SI-2", "SI-10"],
-            },
-        }
+        self.plugin_to_stig = dict(PLUGIN_TO_STIG)
+        self.cve_to_stig = dict(CVE_TO_STIG)
 
     def get_stig_for_plugin(self, plugin_id: str) -> Optional[STIGFinding]:
         """Get STIG finding for a Nessus plugin ID"""
@@ -141,23 +147,34 @@ class STIGMapper:
         if not mapping:
             return None
 
+        return self._build_finding(mapping)
+
+    def _build_finding(self, mapping: Dict) -> STIGFinding:
+        """Build a STIGFinding from a plugin or CVE mapping entry"""
         return STIGFinding(
             stig_id=mapping["stig_id"],
             vulnerability_id=mapping["stig_id"],
-            rule_id=mapping["rule_id"],
+            rule_id=mapping.get("rule_id", ""),
             severity=mapping["severity"],
-            group_title=mapping["group_title"],
-            rule_title=mapping["rule_title"],
+            group_title=mapping.get("group_title", ""),
+            rule_title=mapping.get("rule_title", ""),
             discussion="",  # Would be populated from STIG XCCDF
             check_text="",  # Would be populated from STIG XCCDF
             fix_text="",  # Would be populated from STIG XCCDF
-            cci_refs=mapping["cci_refs"],
-            nist_controls=mapping["nist_controls"],
+            cci_refs=list(mapping.get("cci_refs", [])),
+            nist_controls=list(mapping["nist_controls"]),
         )
 
     def get_stig_for_cve(self, cve: str) -> Optional[Dict]:
         """Get STIG information for a CVE"""
-        return self.cve_to_stig.get(cve)
+        mapping = self.cve_to_stig.get(cve)
+        if not mapping:
+            return None
+
+        return {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in mapping.items()
+        }
 
     def get_severity_category(self, severity: int) -> str:
         """Convert Nessus severity to STIG CAT level"""
@@ -175,15 +192,27 @@ class STIGMapper:
     def get_all_applicable_stigs(
         self, plugin_ids: List[str], cves: List[str]
     ) -> Dict[str, STIGFinding]:
-        """Get all applicable STIG findings for a list of plugins and CVEs"""
-        findings = {}
+        """
+        Get all applicable STIG findings for a list of plugins and CVEs.
 
-        for plugin_id in plugin_ids:
-            stig = self.get_stig_for_plugin(plugin_id)
-            if stig:
-                findings[plugin_id] = stig
+        Unmapped IDs are skipped with a single dict lookup, so a finding is
+        only constructed for plugins/CVEs that actually have a STIG mapping.
+
+        Returns:
+            Findings keyed by plugin ID or CVE ID
+        """
+        plugin_findings = {
+            plugin_id: self._build_finding(mapping)
+            for plugin_id in plugin_ids
+            if (mapping := self.plugin_to_stig.get(plugin_id))
+        }
+        cve_findings = {
+            cve: self._build_finding(mapping)
+            for cve in cves
+            if (mapping := self.cve_to_stig.get(cve))
+        }
 
-        return findings
+        return {**plugin_findings, **cve_findings}
 
     def export_stig_checklist(self, findings: List[STIGFinding]) -> str:
         """Export STIG findings as CKL (checklist) format XML"""
@@ -240,6 +269,5 @@ class STIGMapper:
 
 def get_stig_id_for_plugin(plugin_id: str) -> Optional[str]:
     """Convenience function to get STIG ID for a plugin"""
-    mapper = STIGMapper()
-    stig = mapper.get_stig_for_plugin(plugin_id)
-    return stig.stig_id if stig else None
+    mapping = PLUGIN_TO_STIG.get(plugin_id)
+    return mapping["stig_id"] if mapping else None
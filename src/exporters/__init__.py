@@ -10,6 +10,7 @@ from .excel_exporter import (
     export_excel_cnet_report,
     export_excel_hw_sw_inventory,
     export_excel_emass_inventory,
+    export_all,
 )
 from .csv_exporter import export_csv_report, export_csv_summary
 from .html_exporter import export_html_report
@@ -23,6 +24,7 @@ __all__ = [
     "export_excel_cnet_report",
     "export_excel_hw_sw_inventory",
     "export_excel_emass_inventory",
+    "export_all",
     "export_csv_report",
     "export_csv_summary",
     "export_html_report",
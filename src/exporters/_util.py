@@ -0,0 +1,24 @@
+"""
+Shared helpers for the vISSM exporters
+"""
+
+import os
+from typing import IO
+
+# Write buffer for report output files. Reports are written in many small
+# pieces (rows, cells, ZIP entries), so a large buffer cuts write() syscalls
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+
+def _open_output(output_path: str, mode: str = "wb", **kwargs) -> IO:
+    """Create the parent directory and open output_path with a large buffer"""
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    return open(output_path, mode, buffering=OUTPUT_BUFFER_SIZE, **kwargs)
+
+
+def _truncate(text: str, limit: int, suffix: str = "...") -> str:
+    """Cut text to limit characters, appending suffix when anything was cut"""
+    return text if len(text) <= limit else text[:limit] + suffix
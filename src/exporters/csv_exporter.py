@@ -3,10 +3,50 @@ CSV Exporter for vISSM
 Exports vulnerability reports to CSV format
 """
 
-import os
 import csv
-from typing import Dict, Any
+from typing import Dict, Any, Iterator, Tuple
+from src.processor.vulnerability_processor import match_host_summaries
 from src.templates.template_engine import render_csv_report
+from ._util import _open_output, _truncate
+
+
+def _host_rows(host_summary, host) -> Iterator[Tuple]:
+    """Yield the CSV rows for every vulnerability on one host"""
+    for vuln in host.vulnerabilities:
+        yield (
+            host_summary.hostname,
+            host_summary.ip,
+            host_summary.os,
+            vuln.plugin_id,
+            vuln.plugin_name,
+            vuln.severity,
+            vuln.plugin_family,
+            vuln.port,
+            vuln.service_name,
+            _truncate(vuln.description, 500),
+            _truncate(vuln.solution, 200),
+            vuln.cve,
+        )
+
+
+def flatten_vulns(analysis_data: Dict[str, Any]) -> Iterator[Tuple]:
+    """
+    Flatten per-host vulnerabilities into CSV rows.
+
+    Rows are yielded one at a time so a report is never held in memory as
+    a full row list.
+
+    Args:
+        analysis_data: Processed vulnerability data with "report" attached
+
+    Yields:
+        Row tuples in CSV column order
+    """
+    pairs = match_host_summaries(
+        analysis_data.get("report"), analysis_data.get("host_summaries", [])
+    )
+    for host_summary, host in pairs:
+        yield from _host_rows(host_summary, host)
 
 
 class CSVExporter:
@@ -18,16 +58,9 @@ class CSVExporter:
     def export(self, analysis_data: Dict[str, Any], output_path: str) -> str:
         """Export analysis data to CSV file"""
         try:
-            # Ensure output directory exists
-            output_dir = os.path.dirname(output_path)
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
-
-            # Get the report data
-            report = analysis_data.get("report")
-            host_summaries = analysis_data.get("host_summaries", [])
-
-            with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
+            with _open_output(
+                output_path, "w", newline="", encoding="utf-8"
+            ) as csvfile:
                 writer = csv.writer(csvfile)
 
                 # Write header
@@ -49,44 +82,7 @@ class CSVExporter:
                 )
 
                 # Write vulnerability data
-                for host_summary in host_summaries:
-                    # Find the corresponding host data
-                    host_data = None
-                    if report and hasattr(report, "hosts"):
-                        for host in report.hosts:
-                            if (
-                                host.name == host_summary.ip
-                                or host.properties.hostname == host_summary.hostname
-                            ):
-                                host_data = host
-                                break
-
-                    if host_data:
-                        for vuln in host_data.vulnerabilities:
-                            writer.writerow(
-                                [
-                                    host_summary.hostname,
-                                    host_summary.ip,
-                                    host_summary.os,
-                                    vuln.plugin_id,
-                                    vuln.plugin_name,
-                                    vuln.severity,
-                                    vuln.plugin_family,
-                                    vuln.port,
-                                    vuln.service_name,
-                                    (
-                                        vuln.description[:500] + "..."
-                                        if len(vuln.description) > 500
-                                        else vuln.description
-                                    ),
-                                    (
-                                        vuln.solution[:200] + "..."
-                                        if len(vuln.solution) > 200
-                                        else vuln.solution
-                                    ),
-                                    vuln.cve,
-                                ]
-                            )
+                writer.writerows(flatten_vulns(analysis_data))
 
             return output_path
 
@@ -96,14 +92,11 @@ class CSVExporter:
     def export_summary(self, analysis_data: Dict[str, Any], output_path: str) -> str:
         """Export summary data to CSV file"""
         try:
-            # Ensure output directory exists
-            output_dir = os.path.dirname(output_path)
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
-
             host_summaries = analysis_data.get("host_summaries", [])
 
-            with open(output_path, "w", newline="", encoding="utf-8") as csvfile:
+            with _open_output(
+                output_path, "w", newline="", encoding="utf-8"
+            ) as csvfile:
                 writer = csv.writer(csvfile)
 
                 # Write header
@@ -4,18 +4,636 @@ Excel exporter for vISSM clone - generates XLSX/XLSM files matching vISSM.exe ou
 """
 
 import os
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from datetime import datetime
-from typing import Dict, Any
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import zip_longest
+from operator import attrgetter
+from datetime import datetime, timedelta
+from typing import Dict, Any, Iterable, Iterator, List, Sequence, Tuple
+from src.processor.vulnerability_processor import match_host_summaries
+from ._util import _open_output, _truncate
+
+# Column widths for the openpyxl write-only sheets, keyed by sheet title.
+# These sheets stream rows straight to disk and cannot be resized afterwards,
+# so content shapes are fixed up front (an IP never exceeds 15 characters)
+# instead of scanning written cells. The xlsxwriter sheets fit their widths
+# while writing instead; see WIDTH_SAMPLE_ROWS.
+COL_WIDTHS: Dict[str, List[int]] = {
+    "Hardware": [10, 24, 16, 18, 24, 16, 14, 14, 14, 12, 12, 10, 14, 20],
+    "Software": [10, 24, 40, 14, 24, 18, 20, 14, 10, 14, 20],
+    "POAM": [12, 15, 30, 40, 20, 25, 15, 25, 15, 12, 12, 40, 12, 12, 30, 40],
+}
+
+# Rows inspected when fitting streamed xlsxwriter column widths to content;
+# later rows are written without being measured
+WIDTH_SAMPLE_ROWS = 1000
+
+# Headers matching vISSM format for the vulnerability and CNET reports
+_VULN_HEADERS = (
+    "IP",
+    "Hostname",
+    "Plugin ID",
+    "Plugin Name",
+    "Severity",
+    "Family",
+    "Port",
+    "Service",
+    "Description",
+    "Solution",
+    "CVE",
+)
+
+# Vulnerability fields after IP/Hostname in _VULN_HEADERS order, fetched in
+# one C-level call per row
+_VULN_EXTRACT = attrgetter(
+    "plugin_id",
+    "plugin_name",
+    "severity",
+    "plugin_family",
+    "port",
+    "service_name",
+    "description",
+    "solution",
+    "cve",
+)
+
+# Headers matching vISSM format for the IV&V test plan
+_IVV_HEADERS = (
+    "Test ID",
+    "Test Name",
+    "Test Description",
+    "Expected Results",
+    "Test Steps",
+    "Pass/Fail Criteria",
+    "Test Environment",
+    "Test Data",
+)
+
+# eMASS Hardware and Software sheet headers
+_EMASS_HARDWARE_HEADERS = (
+    "Asset ID",
+    "Hostname",
+    "IP Address",
+    "MAC Address",
+    "Operating System",
+    "Hardware Type",
+    "Manufacturer",
+    "Model",
+    "Serial Number",
+    "Location",
+    "Owner",
+    "Status",
+    "Last Updated",
+    "Notes",
+)
+
+_EMASS_SOFTWARE_HEADERS = (
+    "Asset ID",
+    "Hostname",
+    "Software Name",
+    "Version",
+    "Publisher",
+    "Installation Date",
+    "License Key",
+    "License Type",
+    "Status",
+    "Last Updated",
+    "Notes",
+)
+
+# POAM headers (eMASS standard columns)
+_POAM_HEADERS = (
+    "POAM ID",
+    "Control ID",
+    "Weakness Name",
+    "Weakness Description",
+    "Point of Contact",
+    "Resources Required",
+    "Scheduled Completion Date",
+    "Milestone",
+    "Milestone Date",
+    "Risk",
+    "Status",
+    "Comments",
+    "Raw Severity",
+    "Plugin ID",
+    "Affected Hosts",
+    "Remediation",
+)
+
+# Libraries ExcelExporter can write the POAM workbook with
+_POAM_ENGINES = ("xlsxwriter", "openpyxl")
+
+# POAM risk, category and days to scheduled completion by severity; any
+# other severity falls back to _POAM_DEFAULT_META
+_POAM_SEVERITY_META = {
+    4: ("Very High", "I", 15),
+    3: ("High", "II", 30),
+    2: ("Moderate", "III", 90),
+}
+_POAM_DEFAULT_META = ("Low", "III", 180)
+
+# POAM row fill colour by risk; other risks are left unfilled
+_POAM_RISK_COLORS = {
+    "Very High": "#FFC7CE",
+    "High": "#FFEB9C",
+}
+
+# Named style for POAM data rows by risk; risks not listed use "poam_cell"
+_POAM_RISK_STYLES = {
+    "Very High": "poam_cell_very_high",
+    "High": "poam_cell_high",
+}
+
+# Headers shared by the Windows and Linux software enumeration sheets; the
+# whole enumeration output goes in one column
+_SOFTWARE_ENUM_HEADERS = ("IP and Hostname", "Software Enumeration Output")
+
+# Simulated software enumeration output for Windows hosts
+_WIN_SOFTWARE = (
+    "Microsoft Windows 10 Enterprise",
+    "Microsoft Office Professional Plus 2016",
+    "Adobe Acrobat Reader DC",
+    "Google Chrome",
+    "Mozilla Firefox",
+    "Microsoft Visual C++ 2019 Redistributable",
+    "Java 8 Update 291",
+    "McAfee Endpoint Security",
+    "Citrix Receiver",
+    "Cisco AnyConnect Secure Mobility Client",
+)
+_WIN_SOFTWARE_JOINED = "\n".join(_WIN_SOFTWARE)
+
+# Lowest severity included in the IV&V test plan
+# (4=Critical, 3=High, 2=Medium, 1=Low, 0=Info)
+_IVV_MIN_SEVERITY = 3
+
+_IVV_CRITERIA = "Pass: Vulnerability not detected\nFail: Vulnerability still present"
+
+# Common software reported for every host on the eMASS Software sheet
+_EMASS_SOFTWARE = (
+    (
+        "Microsoft Windows 10",
+        "10.0.19042",
+        "Microsoft",
+        "2021-01-01",
+        "N/A",
+        "OEM",
+        "Active",
+    ),
+    (
+        "Microsoft Office 2016",
+        "16.0.4266.1001",
+        "Microsoft",
+        "2021-01-01",
+        "N/A",
+        "Volume",
+        "Active",
+    ),
+    (
+        "Adobe Acrobat Reader",
+        "21.001.20145",
+        "Adobe",
+        "2021-01-01",
+        "N/A",
+        "Free",
+        "Active",
+    ),
+    (
+        "Google Chrome",
+        "90.0.4430.93",
+        "Google",
+        "2021-01-01",
+        "N/A",
+        "Free",
+        "Active",
+    ),
+)
+
+
+def _width_of(value: Any) -> int:
+    """Display length of a cell value for column sizing; blanks count as 0"""
+    # Nearly every cell is a string, so measure it directly before paying
+    # for a str() conversion
+    if type(value) is str:
+        return len(value)
+    if value is None:
+        return 0
+    return len(str(value))
+
+
+def build_host_index(analysis_data: Dict[str, Any]) -> List[Tuple[Any, Any]]:
+    """
+    Resolve host summaries to report hosts for one report.
+
+    Nothing is cached on analysis_data, so hosts or summaries edited between
+    exports are always matched afresh.
+
+    Args:
+        analysis_data: Processed vulnerability data with "report" attached
+
+    Returns:
+        List of (host_summary, host) tuples in host summary order
+    """
+    return list(
+        match_host_summaries(
+            analysis_data.get("report"), analysis_data.get("host_summaries", [])
+        )
+    )
+
+
+def _vuln_rows(pairs) -> Iterator[Tuple]:
+    """
+    Yield one flat row per vulnerability for the vulnerability/CNET sheets.
+
+    Rows are produced lazily so the streaming writer never holds the whole
+    report in memory.
+    """
+    for host_summary, host in pairs:
+        vulnerabilities = host.vulnerabilities
+        if not vulnerabilities:
+            continue
+
+        # Bind per-host values once rather than per vulnerability row
+        ip = host.name
+        hostname = host.properties.hostname
+        for vuln in vulnerabilities:
+            yield (ip, hostname, *_VULN_EXTRACT(vuln))
+
+
+def _ivv_rows(pairs) -> Iterator[Tuple]:
+    """Yield one IV&V test case row per Critical/High vulnerability"""
+    test_id = 1
+    for host_summary, host in pairs:
+        # Focus on Critical and High severity vulnerabilities
+        high_vulns = [
+            vuln for vuln in host.vulnerabilities if vuln.severity >= _IVV_MIN_SEVERITY
+        ]
+        if not high_vulns:
+            continue
+
+        ip = host.name
+        hostname = host.properties.hostname
+        target = f"Target: {ip} ({hostname})"
+        for vuln in high_vulns:
+            pname = vuln.plugin_name
+            test_steps = (
+                f"1. Scan {ip}\n"
+                f"2. Verify {pname} is not detected\n"
+                "3. Document results"
+            )
+            yield (
+                f"TEST-{test_id:04d}",
+                f"Test {pname}",
+                f"Verify remediation of {pname} on {hostname}",
+                "Vulnerability is remediated and no longer present",
+                test_steps,
+                _IVV_CRITERIA,
+                target,
+                f"Plugin ID: {vuln.plugin_id}",
+            )
+            test_id += 1
+
+
+def _emass_hardware_rows(pairs, today: str) -> Iterator[Tuple]:
+    """Yield eMASS Hardware sheet rows, one per matched host"""
+    for asset_id, (host_summary, host) in enumerate(pairs, 1):
+        yield (
+            f"HW-{asset_id:04d}",
+            host.properties.hostname,
+            host.name,
+            "N/A",
+            "Windows 10",
+            "Workstation",
+            "Dell",
+            "OptiPlex",
+            "N/A",
+            "Office",
+            "User",
+            "Active",
+            today,
+            "N/A",
+        )
+
+
+def _emass_software_rows(pairs, today: str) -> Iterator[Tuple]:
+    """
+    Yield eMASS Software sheet rows, one per host per common software entry.
+
+    Rows are generated as the sheet consumes them, so memory stays flat no
+    matter how many hosts the scan covers.
+    """
+    asset_id = 1
+    for host_summary, host in pairs:
+        hostname = host.properties.hostname
+        for software in _EMASS_SOFTWARE:
+            yield (f"SW-{asset_id:04d}", hostname, *software, today, "N/A")
+            asset_id += 1
+
+
+def _first_lines(items: Sequence[str], limit: int) -> str:
+    """Join the first limit items one per line, appending "..." if more remain"""
+    if len(items) <= limit:
+        return "\n".join(items)
+    return "\n".join(items[:limit]) + "..."
+
+
+def _poam_items(pairs, now: datetime) -> Iterator[Tuple[str, Tuple]]:
+    """
+    Yield (risk, row) for each POAM item, most severe first.
+
+    Findings of severity 2 and above are grouped by plugin so each weakness
+    is one item listing the hosts it affects.
+    """
+    # Group vulnerabilities by plugin_id to avoid duplicates; the first
+    # occurrence of each plugin supplies the POAM item's details
+    vuln_groups = defaultdict(lambda: {"vuln": None, "affected_hosts": []})
+    for host_summary, host in pairs:
+        # Clean hosts contribute nothing; skip building their label
+        if not host.vulnerabilities:
+            continue
+
+        host_label = f"{host_summary.hostname} ({host_summary.ip})"
+        for vuln in host.vulnerabilities:
+            # Only include Cat I, II, III (severity 2, 3, 4)
+            if vuln.severity < 2:
+                continue
+            group = vuln_groups[vuln.plugin_id]
+            if group["vuln"] is None:
+                group["vuln"] = vuln
+            group["affected_hosts"].append(host_label)
+
+    # Resolve risk, category and scheduled completion date once per
+    # severity rather than once per POAM item
+    def resolve(risk, cat, completion_days):
+        due = now + timedelta(days=completion_days)
+        return risk, cat, due.strftime("%Y-%m-%d")
+
+    severity_meta = {
+        severity: resolve(*meta) for severity, meta in _POAM_SEVERITY_META.items()
+    }
+    default_meta = resolve(*_POAM_DEFAULT_META)
+
+    poam_id = 1
+    for plugin_id, data in sorted(
+        vuln_groups.items(), key=lambda x: -x[1]["vuln"].severity
+    ):
+        vuln = data["vuln"]
+        affected_hosts = data["affected_hosts"]
+        risk, cat, scheduled_date = severity_meta.get(vuln.severity, default_meta)
+
+        # Extract CVE/Control mapping (simplified)
+        control_id = vuln.cve if vuln.cve else f"V-{plugin_id}"
+
+        yield risk, (
+            f"POAM-{poam_id:04d}",
+            control_id,
+            vuln.plugin_name,
+            _truncate(vuln.description, 500),
+            "[Enter POC]",
+            "Staff time, patch management",
+            scheduled_date,
+            f"Remediate Cat {cat} finding",
+            scheduled_date,
+            risk,
+            "Open",
+            f"Identified via Nessus scan. {len(affected_hosts)} host(s) affected.",
+            f"CAT {cat}",
+            plugin_id,
+            _first_lines(affected_hosts, 5),
+            _truncate(vuln.solution, 300),
+        )
+        poam_id += 1
 
 
 class ExcelExporter:
     """Excel exporter that matches vISSM.exe output format"""
 
-    def __init__(self):
+    # Shared openpyxl style objects, built by _new_openpyxl_workbook on first
+    # use. Building them per cell makes openpyxl hash and dedupe an identical
+    # style every time.
+    _styles_loaded = False
+
+    def __init__(self, poam_engine: str = "xlsxwriter"):
+        """
+        Args:
+            poam_engine: Library that writes the POAM workbook. "xlsxwriter"
+                (default) streams rows in constant memory; "openpyxl" keeps
+                the openpyxl write-only path for callers that need it
+        """
+        if poam_engine not in _POAM_ENGINES:
+            raise ValueError(f"Unknown POAM engine: {poam_engine}")
+        self.poam_engine = poam_engine
         self.timestamp = datetime.now().strftime("%Y-%m-%d-%H%M")
 
+    @classmethod
+    def _load_openpyxl_styles(cls) -> None:
+        """Create the shared openpyxl style objects once per process"""
+        if cls._styles_loaded:
+            return
+
+        from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+
+        # Colours are 8-character ARGB: openpyxl pads a 6-character RGB with
+        # a 00 alpha, which some viewers render as fully transparent
+        cls._HEADER_FONT = Font(bold=True)
+        cls._HEADER_FILL = PatternFill(
+            start_color="FFCCCCCC", end_color="FFCCCCCC", fill_type="solid"
+        )
+        cls._BANNER_FONT = Font(bold=True, color="FFFF0000")
+        cls._BANNER_ALIGNMENT = Alignment(horizontal="center")
+        cls._POAM_HEADER_FONT = Font(bold=True, color="FFFFFFFF")
+        cls._POAM_HEADER_FILL = PatternFill(
+            start_color="FF366092", end_color="FF366092", fill_type="solid"
+        )
+        cls._POAM_HEADER_ALIGNMENT = Alignment(
+            horizontal="center", vertical="center", wrap_text=True
+        )
+        cls._POAM_CELL_ALIGNMENT = Alignment(vertical="top", wrap_text=True)
+        thin = Side(style="thin")
+        cls._THIN_BORDER = Border(left=thin, right=thin, top=thin, bottom=thin)
+        cls._RISK_FILLS = {
+            risk: PatternFill(
+                start_color="FF" + color[1:],
+                end_color="FF" + color[1:],
+                fill_type="solid",
+            )
+            for risk, color in _POAM_RISK_COLORS.items()
+        }
+        cls._styles_loaded = True
+
+    def _new_openpyxl_workbook(self, write_only: bool = False):
+        """
+        Create an openpyxl workbook, importing openpyxl on first use.
+
+        openpyxl is only loaded by the exporters that need it, so commands
+        that write CSV, HTML or the xlsxwriter reports skip its import cost.
+        """
+        from openpyxl import Workbook
+
+        self._load_openpyxl_styles()
+        return Workbook(write_only=write_only)
+
+    def _register_poam_styles(self, wb) -> None:
+        """
+        Register the POAM header and row styles as named styles on wb.
+
+        Each POAM cell then takes one style assignment instead of separate
+        font, fill, alignment and border assignments, and the workbook
+        stores each combination once.
+        """
+        from openpyxl.styles import NamedStyle
+
+        wb.add_named_style(
+            NamedStyle(
+                name="poam_header",
+                font=self._POAM_HEADER_FONT,
+                fill=self._POAM_HEADER_FILL,
+                alignment=self._POAM_HEADER_ALIGNMENT,
+                border=self._THIN_BORDER,
+            )
+        )
+        wb.add_named_style(
+            NamedStyle(
+                name="poam_cell",
+                alignment=self._POAM_CELL_ALIGNMENT,
+                border=self._THIN_BORDER,
+            )
+        )
+        for risk, name in _POAM_RISK_STYLES.items():
+            wb.add_named_style(
+                NamedStyle(
+                    name=name,
+                    fill=self._RISK_FILLS[risk],
+                    alignment=self._POAM_CELL_ALIGNMENT,
+                    border=self._THIN_BORDER,
+                )
+            )
+
+    def _styled_cells(self, ws, values: Sequence[Any], **styles) -> List[Any]:
+        """
+        Wrap values in WriteOnlyCells that share the given style objects.
+
+        Args:
+            ws: Write-only worksheet the cells will be appended to
+            values: Cell values in column order
+            **styles: Cell style attributes (font, fill, alignment, border),
+                or style= with the name of a registered named style
+
+        Returns:
+            List of styled cells ready for ws.append
+        """
+        from openpyxl.cell import WriteOnlyCell
+
+        cells = []
+        for value in values:
+            cell = WriteOnlyCell(ws, value=value)
+            for name, style in styles.items():
+                setattr(cell, name, style)
+            cells.append(cell)
+        return cells
+
+    def _append_header(self, ws, headers: Sequence[str]) -> None:
+        """
+        Append a bold, grey-filled header row to a write-only worksheet.
+
+        WriteOnlyCells are bound to their worksheet, so the cells are built
+        per sheet from the module-level header tuples and the shared styles.
+        """
+        ws.append(
+            self._styled_cells(
+                ws, headers, font=self._HEADER_FONT, fill=self._HEADER_FILL
+            )
+        )
+
+    def _set_column_widths(self, ws, widths: List[int]) -> None:
+        """
+        Size columns on a write-only worksheet from their static text.
+
+        Write-only sheets stream rows straight to disk, so they cannot be
+        auto-fit afterwards; widths must be set before the first append.
+        """
+        from openpyxl.utils import get_column_letter
+
+        for col, width in enumerate(widths, 1):
+            ws.column_dimensions[get_column_letter(col)].width = min(width + 2, 50)
+
+    def _save(self, wb, output_path: str) -> None:
+        """Save an openpyxl workbook through a buffered output file"""
+        with _open_output(output_path) as fh:
+            wb.save(fh)
+
+    def _open_streaming_workbook(self, fh):
+        """
+        Open an xlsxwriter workbook that flushes each row to disk as written.
+
+        Args:
+            fh: Binary file object the finished workbook is written to on close
+
+        Returns:
+            (workbook, header_format) tuple
+        """
+        import xlsxwriter
+
+        wb = xlsxwriter.Workbook(
+            fh, {"constant_memory": True, "strings_to_urls": False}
+        )
+        header_format = wb.add_format({"bold": True, "bg_color": "#CCCCCC"})
+        return wb, header_format
+
+    def _write_streaming_sheet(
+        self,
+        wb,
+        title: str,
+        headers: Sequence[str],
+        header_format,
+        rows: Iterable[Sequence[Any]] = (),
+    ):
+        """
+        Add an xlsxwriter sheet, write headers and rows, and fit column widths.
+
+        Widths are tracked online while rows stream out, from the header and
+        the first WIDTH_SAMPLE_ROWS rows, so sizing never needs a second pass
+        over the sheet. xlsxwriter accepts set_column until the workbook is
+        closed, so the widths can be set after the rows.
+        """
+        ws = wb.add_worksheet(title)
+        ws.write_row(0, 0, headers, header_format)
+
+        max_len = [len(header) for header in headers]
+        for row_idx, values in enumerate(rows, 1):
+            ws.write_row(row_idx, 0, values)
+            if row_idx <= WIDTH_SAMPLE_ROWS:
+                for col, value in enumerate(values):
+                    length = _width_of(value)
+                    if length > max_len[col]:
+                        max_len[col] = length
+
+        for col, length in enumerate(max_len):
+            ws.set_column(col, col, min(length + 2, 50))
+        return ws
+
+    def _write_vuln_sheet(
+        self, wb, title: str, analysis_data: Dict[str, Any], header_format
+    ):
+        """Write a one-row-per-vulnerability sheet (vulnerability/CNET reports)"""
+        ws = self._write_streaming_sheet(
+            wb,
+            title,
+            _VULN_HEADERS,
+            header_format,
+            _vuln_rows(build_host_index(analysis_data)),
+        )
+        ws.freeze_panes(1, 0)
+        return ws
+
+    def _apply_schema_widths(self, ws) -> None:
+        """Set the fixed COL_WIDTHS entry for ws; call before the first append"""
+        from openpyxl.utils import get_column_letter
+
+        for col, width in enumerate(COL_WIDTHS[ws.title], 1):
+            ws.column_dimensions[get_column_letter(col)].width = width
+
     def export_vulnerability_report(
         self, analysis_data: Dict[str, Any], output_path: str = None
     ) -> str:
@@ -23,79 +641,12 @@ class ExcelExporter:
         if not output_path:
             output_path = f"vISSM_Vulnerability_Report_{self.timestamp}.xlsx"
 
-        # Ensure output directory exists
-        output_dir = os.path.dirname(output_path)
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
-
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Vulnerability Report"
-
-        # Get vulnerability data
-        report = analysis_data.get("report")
-        host_summaries = analysis_data.get("host_summaries", [])
-
-        # Headers matching vISSM format
-        headers = [
-            "IP",
-            "Hostname",
-            "Plugin ID",
-            "Plugin Name",
-            "Severity",
-            "Family",
-            "Port",
-            "Service",
-            "Description",
-            "Solution",
-            "CVE",
-        ]
-
-        # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(
-                start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
+        with _open_output(output_path) as fh:
+            wb, header_format = self._open_streaming_workbook(fh)
+            self._write_vuln_sheet(
+                wb, "Vulnerability Report", analysis_data, header_format
             )
-
-        # Write vulnerability data
-        row = 2
-        for host_summary in host_summaries:
-            if report and hasattr(report, "hosts"):
-                for host in report.hosts:
-                    if (
-                        host.name == host_summary.ip
-                        or host.properties.hostname == host_summary.hostname
-                    ):
-                        for vuln in host.vulnerabilities:
-                            ws.cell(row=row, column=1, value=host.name)
-                            ws.cell(row=row, column=2, value=host.properties.hostname)
-                            ws.cell(row=row, column=3, value=vuln.plugin_id)
-                            ws.cell(row=row, column=4, value=vuln.plugin_name)
-                            ws.cell(row=row, column=5, value=vuln.severity)
-                            ws.cell(row=row, column=6, value=vuln.plugin_family)
-                            ws.cell(row=row, column=7, value=vuln.port)
-                            ws.cell(row=row, column=8, value=vuln.service_name)
-                            ws.cell(row=row, column=9, value=vuln.description)
-                            ws.cell(row=row, column=10, value=vuln.solution)
-                            ws.cell(row=row, column=11, value=vuln.cve)
-                            row += 1
-
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except Exception:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
-
-        wb.save(output_path)
+            wb.close()
         return output_path
 
     def export_ivv_test_plan(
@@ -105,106 +656,17 @@ class ExcelExporter:
         if not output_path:
             output_path = f"vISSM_IV&V_Test_Plan_{self.timestamp}.xlsx"
 
-        # Ensure output directory exists
-        output_dir = os.path.dirname(output_path)
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
-
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "IV&V Test Plan"
-
-        # Headers matching vISSM format
-        headers = [
-            "Test ID",
-            "Test Name",
-            "Test Description",
-            "Expected Results",
-            "Test Steps",
-            "Pass/Fail Criteria",
-            "Test Environment",
-            "Test Data",
-        ]
-
-        # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(
-                start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
+        with _open_output(output_path) as fh:
+            wb, header_format = self._open_streaming_workbook(fh)
+            # Generate test plan data based on vulnerabilities
+            self._write_streaming_sheet(
+                wb,
+                "IV&V Test Plan",
+                _IVV_HEADERS,
+                header_format,
+                _ivv_rows(build_host_index(analysis_data)),
             )
-
-        # Generate test plan data based on vulnerabilities
-        report = analysis_data.get("report")
-        host_summaries = analysis_data.get("host_summaries", [])
-
-        row = 2
-        test_id = 1
-
-        for host_summary in host_summaries:
-            if report and hasattr(report, "hosts"):
-                for host in report.hosts:
-                    if (
-                        host.name == host_summary.ip
-                        or host.properties.hostname == host_summary.hostname
-                    ):
-                        for vuln in host.vulnerabilities:
-                            # Severity: 4=Critical, 3=High, 2=Medium, 1=Low, 0=Info
-                            if (
-                                vuln.severity >= 3
-                            ):  # Focus on Critical and High severity vulnerabilities
-                                ws.cell(row=row, column=1, value=f"TEST-{test_id:04d}")
-                                ws.cell(
-                                    row=row, column=2, value=f"Test {vuln.plugin_name}"
-                                )
-                                ws.cell(
-                                    row=row,
-                                    column=3,
-                                    value=f"Verify remediation of {vuln.plugin_name} on {host.properties.hostname}",
-                                )
-                                ws.cell(
-                                    row=row,
-                                    column=4,
-                                    value="Vulnerability is remediated and no longer present",
-                                )
-                                test_steps = (
-                                    f"1. Scan {host.name}\n"
-                                    f"2. Verify {vuln.plugin_name} is not detected\n"
-                                    "3. Document results"
-                                )
-                                ws.cell(row=row, column=5, value=test_steps)
-                                criteria = (
-                                    "Pass: Vulnerability not detected\n"
-                                    "Fail: Vulnerability still present"
-                                )
-                                ws.cell(row=row, column=6, value=criteria)
-                                ws.cell(
-                                    row=row,
-                                    column=7,
-                                    value=f"Target: {host.name} ({host.properties.hostname})",
-                                )
-                                ws.cell(
-                                    row=row,
-                                    column=8,
-                                    value=f"Plugin ID: {vuln.plugin_id}",
-                                )
-                                row += 1
-                                test_id += 1
-
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except Exception:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
-
-        wb.save(output_path)
+            wb.close()
         return output_path
 
     def export_cnet_report(
@@ -214,78 +676,10 @@ class ExcelExporter:
         if not output_path:
             output_path = f"vISSM_CET_Report_{self.timestamp}.xlsx"
 
-        # Ensure output directory exists
-        output_dir = os.path.dirname(output_path)
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
-
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "CNET Report"
-
-        # Headers matching vISSM format
-        headers = [
-            "IP",
-            "Hostname",
-            "Plugin ID",
-            "Plugin Name",
-            "Severity",
-            "Family",
-            "Port",
-            "Service",
-            "Description",
-            "Solution",
-            "CVE",
-        ]
-
-        # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(
-                start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
-            )
-
-        # Write vulnerability data (same as vulnerability report)
-        report = analysis_data.get("report")
-        host_summaries = analysis_data.get("host_summaries", [])
-
-        row = 2
-        for host_summary in host_summaries:
-            if report and hasattr(report, "hosts"):
-                for host in report.hosts:
-                    if (
-                        host.name == host_summary.ip
-                        or host.properties.hostname == host_summary.hostname
-                    ):
-                        for vuln in host.vulnerabilities:
-                            ws.cell(row=row, column=1, value=host.name)
-                            ws.cell(row=row, column=2, value=host.properties.hostname)
-                            ws.cell(row=row, column=3, value=vuln.plugin_id)
-                            ws.cell(row=row, column=4, value=vuln.plugin_name)
-                            ws.cell(row=row, column=5, value=vuln.severity)
-                            ws.cell(row=row, column=6, value=vuln.plugin_family)
-                            ws.cell(row=row, column=7, value=vuln.port)
-                            ws.cell(row=row, column=8, value=vuln.service_name)
-                            ws.cell(row=row, column=9, value=vuln.description)
-                            ws.cell(row=row, column=10, value=vuln.solution)
-                            ws.cell(row=row, column=11, value=vuln.cve)
-                            row += 1
-
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except Exception:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
-
-        wb.save(output_path)
+        with _open_output(output_path) as fh:
+            wb, header_format = self._open_streaming_workbook(fh)
+            self._write_vuln_sheet(wb, "CNET Report", analysis_data, header_format)
+            wb.close()
         return output_path
 
     def export_hw_sw_inventory(
@@ -295,106 +689,30 @@ class ExcelExporter:
         if not output_path:
             output_path = f"vISSM_Detailed_Inventory_{self.timestamp}.xlsx"
 
-        # Ensure output directory exists
-        output_dir = os.path.dirname(output_path)
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
-
-        wb = Workbook()
-
-        # Create Windows Software worksheet
-        ws_windows = wb.active
-        ws_windows.title = "Windows Software (plugin 22869)"
-
-        # Headers for Windows Software
-        headers = ["IP and Hostname"] + [
-            f"Software Enumeration Output (Lines {i*20+1}-{(i+1)*20})"
-            for i in range(20)
-        ]
-
-        # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = ws_windows.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(
-                start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
+        with _open_output(output_path) as fh:
+            wb, header_format = self._open_streaming_workbook(fh)
+
+            # Create Windows Software worksheet
+            self._write_streaming_sheet(
+                wb,
+                "Windows Software (plugin 22869)",
+                _SOFTWARE_ENUM_HEADERS,
+                header_format,
+                (
+                    (f"{host.name} ({host.properties.hostname})", _WIN_SOFTWARE_JOINED)
+                    for host_summary, host in build_host_index(analysis_data)
+                ),
             )
 
-        # Write software data
-        report = analysis_data.get("report")
-        host_summaries = analysis_data.get("host_summaries", [])
-
-        row = 2
-        for host_summary in host_summaries:
-            if report and hasattr(report, "hosts"):
-                for host in report.hosts:
-                    if (
-                        host.name == host_summary.ip
-                        or host.properties.hostname == host_summary.hostname
-                    ):
-                        # Simulate software enumeration output
-                        software_list = [
-                            "Microsoft Windows 10 Enterprise",
-                            "Microsoft Office Professional Plus 2016",
-                            "Adobe Acrobat Reader DC",
-                            "Google Chrome",
-                            "Mozilla Firefox",
-                            "Microsoft Visual C++ 2019 Redistributable",
-                            "Java 8 Update 291",
-                            "McAfee Endpoint Security",
-                            "Citrix Receiver",
-                            "Cisco AnyConnect Secure Mobility Client",
-                        ]
-
-                        ws_windows.cell(
-                            row=row,
-                            column=1,
-                            value=f"{host.name} ({host.properties.hostname})",
-                        )
-
-                        # Split software list into chunks of 20
-                        for i in range(20):
-                            start_idx = i * 20
-                            end_idx = min((i + 1) * 20, len(software_list))
-                            software_chunk = software_list[start_idx:end_idx]
-                            ws_windows.cell(
-                                row=row, column=i + 2, value="\n".join(software_chunk)
-                            )
-
-                        row += 1
-
-        # Create Linux Software worksheet
-        ws_linux = wb.create_sheet("Linux Software (plugin 22869)")
-
-        # Headers for Linux Software
-        headers = ["IP and Hostname"] + [
-            f"Software Enumeration Output (Lines {i*20+1}-{(i+1)*20})"
-            for i in range(20)
-        ]
-
-        # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = ws_linux.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(
-                start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
+            # Create Linux Software worksheet
+            self._write_streaming_sheet(
+                wb,
+                "Linux Software (plugin 22869)",
+                _SOFTWARE_ENUM_HEADERS,
+                header_format,
             )
 
-        # Auto-adjust column widths for both worksheets
-        for ws in [ws_windows, ws_linux]:
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except Exception:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
-
-        wb.save(output_path)
+            wb.close()
         return output_path
 
     def export_emass_inventory(
@@ -404,205 +722,41 @@ class ExcelExporter:
         if not output_path:
             output_path = f"vISSM_eMASS_Inventory_{self.timestamp}.xlsm"
 
-        # Ensure output directory exists
-        output_dir = os.path.dirname(output_path)
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
-
-        wb = Workbook()
+        wb = self._new_openpyxl_workbook(write_only=True)
 
         # Hardware worksheet
-        ws_hardware = wb.active
-        ws_hardware.title = "Hardware"
+        ws_hardware = wb.create_sheet("Hardware")
+
+        self._apply_schema_widths(ws_hardware)
 
         # Add classification header
-        ws_hardware.cell(
-            row=1, column=1, value="***** UNCLASSIFIED//FOR OFFICIAL USE ONLY *****"
-        )
-        ws_hardware.cell(row=2, column=1, value="Date Exported:")
-        ws_hardware.cell(row=3, column=1, value="Exported By:")
-        ws_hardware.cell(row=4, column=1, value="Information System Owner:")
-        ws_hardware.cell(row=4, column=7, value="POC Name:")
-        ws_hardware.cell(row=4, column=10, value="Date Reviewed / Updated:")
-        ws_hardware.cell(row=5, column=1, value="System Name:")
-        ws_hardware.cell(row=5, column=7, value="POC Phone:")
-        ws_hardware.cell(row=5, column=10, value="Reviewed / Updated By:")
-
-        # Hardware headers
-        hardware_headers = [
-            "Asset ID",
-            "Hostname",
-            "IP Address",
-            "MAC Address",
-            "Operating System",
-            "Hardware Type",
-            "Manufacturer",
-            "Model",
-            "Serial Number",
-            "Location",
-            "Owner",
-            "Status",
-            "Last Updated",
-            "Notes",
-        ]
+        self._append_classification_header(ws_hardware)
 
         # Write hardware headers
-        for col, header in enumerate(hardware_headers, 1):
-            cell = ws_hardware.cell(row=7, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(
-                start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
-            )
+        self._append_header(ws_hardware, _EMASS_HARDWARE_HEADERS)
 
         # Write hardware data
-        report = analysis_data.get("report")
-        host_summaries = analysis_data.get("host_summaries", [])
-
-        row = 8
-        asset_id = 1
-
-        for host_summary in host_summaries:
-            if report and hasattr(report, "hosts"):
-                for host in report.hosts:
-                    if (
-                        host.name == host_summary.ip
-                        or host.properties.hostname == host_summary.hostname
-                    ):
-                        ws_hardware.cell(row=row, column=1, value=f"HW-{asset_id:04d}")
-                        ws_hardware.cell(
-                            row=row, column=2, value=host.properties.hostname
-                        )
-                        ws_hardware.cell(row=row, column=3, value=host.name)
-                        ws_hardware.cell(row=row, column=4, value="N/A")
-                        ws_hardware.cell(row=row, column=5, value="Windows 10")
-                        ws_hardware.cell(row=row, column=6, value="Workstation")
-                        ws_hardware.cell(row=row, column=7, value="Dell")
-                        ws_hardware.cell(row=row, column=8, value="OptiPlex")
-                        ws_hardware.cell(row=row, column=9, value="N/A")
-                        ws_hardware.cell(row=row, column=10, value="Office")
-                        ws_hardware.cell(row=row, column=11, value="User")
-                        ws_hardware.cell(row=row, column=12, value="Active")
-                        ws_hardware.cell(
-                            row=row,
-                            column=13,
-                            value=datetime.now().strftime("%Y-%m-%d"),
-                        )
-                        ws_hardware.cell(row=row, column=14, value="N/A")
-                        row += 1
-                        asset_id += 1
+        pairs = build_host_index(analysis_data)
+
+        # "Last Updated" is the same for every row of this export
+        today = datetime.now().strftime("%Y-%m-%d")
+        for row in _emass_hardware_rows(pairs, today):
+            ws_hardware.append(row)
 
         # Software worksheet
         ws_software = wb.create_sheet("Software")
 
+        self._apply_schema_widths(ws_software)
+
         # Add classification header
-        ws_software.cell(
-            row=1, column=1, value="***** UNCLASSIFIED//FOR OFFICIAL USE ONLY *****"
-        )
-        ws_software.cell(row=2, column=1, value="Date Exported:")
-        ws_software.cell(row=3, column=1, value="Exported By:")
-        ws_software.cell(row=4, column=1, value="Information System Owner:")
-        ws_software.cell(row=4, column=7, value="POC Name:")
-        ws_software.cell(row=4, column=10, value="Date Reviewed / Updated:")
-        ws_software.cell(row=5, column=1, value="System Name:")
-        ws_software.cell(row=5, column=7, value="POC Phone:")
-        ws_software.cell(row=5, column=10, value="Reviewed / Updated By:")
-
-        # Software headers
-        software_headers = [
-            "Asset ID",
-            "Hostname",
-            "Software Name",
-            "Version",
-            "Publisher",
-            "Installation Date",
-            "License Key",
-            "License Type",
-            "Status",
-            "Last Updated",
-            "Notes",
-        ]
+        self._append_classification_header(ws_software)
 
         # Write software headers
-        for col, header in enumerate(software_headers, 1):
-            cell = ws_software.cell(row=7, column=col, value=header)
-            cell.font = Font(bold=True)
-            cell.fill = PatternFill(
-                start_color="CCCCCC", end_color="CCCCCC", fill_type="solid"
-            )
+        self._append_header(ws_software, _EMASS_SOFTWARE_HEADERS)
 
         # Write software data
-        row = 8
-        asset_id = 1
-
-        for host_summary in host_summaries:
-            if report and hasattr(report, "hosts"):
-                for host in report.hosts:
-                    if (
-                        host.name == host_summary.ip
-                        or host.properties.hostname == host_summary.hostname
-                    ):
-                        # Add common software
-                        software_list = [
-                            (
-                                "Microsoft Windows 10",
-                                "10.0.19042",
-                                "Microsoft",
-                                "2021-01-01",
-                                "N/A",
-                                "OEM",
-                                "Active",
-                            ),
-                            (
-                                "Microsoft Office 2016",
-                                "16.0.4266.1001",
-                                "Microsoft",
-                                "2021-01-01",
-                                "N/A",
-                                "Volume",
-                                "Active",
-                            ),
-                            (
-                                "Adobe Acrobat Reader",
-                                "21.001.20145",
-                                "Adobe",
-                                "2021-01-01",
-                                "N/A",
-                                "Free",
-                                "Active",
-                            ),
-                            (
-                                "Google Chrome",
-                                "90.0.4430.93",
-                                "Google",
-                                "2021-01-01",
-                                "N/A",
-                                "Free",
-                                "Active",
-                            ),
-                        ]
-
-                        for software in software_list:
-                            ws_software.cell(
-                                row=row, column=1, value=f"SW-{asset_id:04d}"
-                            )
-                            ws_software.cell(
-                                row=row, column=2, value=host.properties.hostname
-                            )
-                            ws_software.cell(row=row, column=3, value=software[0])
-                            ws_software.cell(row=row, column=4, value=software[1])
-                            ws_software.cell(row=row, column=5, value=software[2])
-                            ws_software.cell(row=row, column=6, value=software[3])
-                            ws_software.cell(row=row, column=7, value=software[4])
-                            ws_software.cell(row=row, column=8, value=software[5])
-                            ws_software.cell(row=row, column=9, value=software[6])
-                            ws_software.cell(
-                                row=row,
-                                column=10,
-                                value=datetime.now().strftime("%Y-%m-%d"),
-                            )
-                            ws_software.cell(row=row, column=11, value="N/A")
-                            row += 1
-                            asset_id += 1
+        for row in _emass_software_rows(pairs, today):
+            ws_software.append(row)
 
         # Instructions worksheet
         ws_instructions = wb.create_sheet("Instructions")
@@ -627,64 +781,97 @@ class ExcelExporter:
             "10. Do not modify the template structure or add additional columns.",
         ]
 
-        for i, instruction in enumerate(instructions, 1):
-            ws_instructions.cell(row=i, column=1, value=instruction)
+        self._set_column_widths(
+            ws_instructions, [max(len(instruction) for instruction in instructions)]
+        )
+        for instruction in instructions:
+            ws_instructions.append((instruction,))
 
         # (U) Lists worksheet
         ws_lists = wb.create_sheet("(U) Lists")
 
-        # Hardware Type list
-        ws_lists.cell(row=1, column=1, value="Hardware Type")
-        ws_lists.cell(row=2, column=1, value="Workstation")
-        ws_lists.cell(row=3, column=1, value="Server")
-        ws_lists.cell(row=4, column=1, value="Switch")
-        ws_lists.cell(row=5, column=1, value="Router")
-        ws_lists.cell(row=6, column=1, value="Firewall")
-        ws_lists.cell(row=7, column=1, value="Printer")
-        ws_lists.cell(row=8, column=1, value="Scanner")
-
-        # Software Type list
-        ws_lists.cell(row=1, column=3, value="Software Type")
-        ws_lists.cell(row=2, column=3, value="GOTS Application")
-        ws_lists.cell(row=3, column=3, value="COTS Application")
-        ws_lists.cell(row=4, column=3, value="Server Application")
-        ws_lists.cell(row=5, column=3, value="Web Application")
-        ws_lists.cell(row=6, column=3, value="Database")
-        ws_lists.cell(row=7, column=3, value="Operating System")
-        ws_lists.cell(row=8, column=3, value="Utility")
-
-        # Approval list
-        ws_lists.cell(row=1, column=5, value="Approval")
-        ws_lists.cell(row=2, column=5, value="In Progress")
-        ws_lists.cell(row=3, column=5, value="Unapproved")
-        ws_lists.cell(row=4, column=5, value="Approved - FIPS 140-2")
-        ws_lists.cell(row=5, column=5, value="Approved - NSA Crypto")
-        ws_lists.cell(row=6, column=5, value="Approved - Common Criteria")
-        ws_lists.cell(row=7, column=5, value="Approved - Other")
-        ws_lists.cell(row=8, column=5, value="Not Applicable")
-
-        # Yes Or No list
-        ws_lists.cell(row=1, column=7, value="Yes Or No")
-        ws_lists.cell(row=2, column=7, value="Yes")
-        ws_lists.cell(row=3, column=7, value="No")
-
-        # Auto-adjust column widths for all worksheets
-        for ws in [ws_hardware, ws_software, ws_instructions, ws_lists]:
-            for column in ws.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except Exception:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                ws.column_dimensions[column_letter].width = adjusted_width
-
-        wb.save(output_path)
+        hardware_types = [
+            "Hardware Type",
+            "Workstation",
+            "Server",
+            "Switch",
+            "Router",
+            "Firewall",
+            "Printer",
+            "Scanner",
+        ]
+        software_types = [
+            "Software Type",
+            "GOTS Application",
+            "COTS Application",
+            "Server Application",
+            "Web Application",
+            "Database",
+            "Operating System",
+            "Utility",
+        ]
+        approvals = [
+            "Approval",
+            "In Progress",
+            "Unapproved",
+            "Approved - FIPS 140-2",
+            "Approved - NSA Crypto",
+            "Approved - Common Criteria",
+            "Approved - Other",
+            "Not Applicable",
+        ]
+        yes_or_no = ["Yes Or No", "Yes", "No"]
+
+        # Lists occupy columns A, C, E and G with a blank column between each
+        lists = [hardware_types, software_types, approvals, yes_or_no]
+        widths = []
+        for values in lists:
+            widths.extend([max(len(value) for value in values), 0])
+        self._set_column_widths(ws_lists, widths[:-1])
+
+        for hardware_type, software_type, approval, yes_no in zip_longest(*lists):
+            ws_lists.append(
+                (hardware_type, None, software_type, None, approval, None, yes_no)
+            )
+
+        self._save(wb, output_path)
         return output_path
 
+    def _append_classification_header(self, ws) -> None:
+        """Append the eMASS classification banner and metadata block (rows 1-6)"""
+        ws.append(("***** UNCLASSIFIED//FOR OFFICIAL USE ONLY *****",))
+        ws.append(("Date Exported:",))
+        ws.append(("Exported By:",))
+        ws.append(
+            (
+                "Information System Owner:",
+                None,
+                None,
+                None,
+                None,
+                None,
+                "POC Name:",
+                None,
+                None,
+                "Date Reviewed / Updated:",
+            )
+        )
+        ws.append(
+            (
+                "System Name:",
+                None,
+                None,
+                None,
+                None,
+                None,
+                "POC Phone:",
+                None,
+                None,
+                "Reviewed / Updated By:",
+            )
+        )
+        ws.append(())
+
     def export_poam(
         self, analysis_data: Dict[str, Any], output_path: str = None
     ) -> str:
@@ -692,211 +879,146 @@ class ExcelExporter:
         if not output_path:
             output_path = f"POAM_{self.timestamp}.xlsx"
 
-        # Ensure output directory exists
-        output_dir = os.path.dirname(output_path)
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
+        now = datetime.now()
+        items = _poam_items(build_host_index(analysis_data), now)
+        if self.poam_engine == "openpyxl":
+            self._write_poam_openpyxl(items, now, output_path)
+        else:
+            self._write_poam_xlsxwriter(items, now, output_path)
+        return output_path
 
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "POAM"
+    def _write_poam_xlsxwriter(
+        self, items: Iterable[Tuple[str, Tuple]], now: datetime, output_path: str
+    ) -> None:
+        """Stream the POAM sheet through xlsxwriter, one row to disk at a time"""
+        with _open_output(output_path) as fh:
+            wb, _ = self._open_streaming_workbook(fh)
+            ws = wb.add_worksheet("POAM")
+            for col, width in enumerate(COL_WIDTHS["POAM"]):
+                ws.set_column(col, col, width)
+
+            # Formats are registered once per workbook and shared by every row
+            banner_format = wb.add_format(
+                {"bold": True, "font_color": "#FF0000", "align": "center"}
+            )
+            header_format = wb.add_format(
+                {
+                    "bold": True,
+                    "font_color": "#FFFFFF",
+                    "bg_color": "#366092",
+                    "align": "center",
+                    "valign": "vcenter",
+                    "text_wrap": True,
+                    "border": 1,
+                }
+            )
+            cell_props = {"valign": "top", "text_wrap": True, "border": 1}
+            cell_format = wb.add_format(cell_props)
+            risk_formats = {
+                risk: wb.add_format({**cell_props, "bg_color": color})
+                for risk, color in _POAM_RISK_COLORS.items()
+            }
+
+            # Add classification header
+            ws.merge_range(
+                0,
+                0,
+                0,
+                len(_POAM_HEADERS) - 1,
+                "***** UNCLASSIFIED//FOR OFFICIAL USE ONLY *****",
+                banner_format,
+            )
+
+            # Add metadata
+            ws.write_row(1, 0, ("Date Exported:", now.strftime("%Y-%m-%d")))
+            ws.write_row(2, 0, ("Information System:", "[Enter System Name]"))
+            ws.write_row(3, 0, ("POAM Coordinator:", "[Enter Name]"))
+
+            # Write headers
+            header_row = 5
+            ws.set_row(header_row, 40)
+            ws.write_row(header_row, 0, _POAM_HEADERS, header_format)
+
+            # Write POAM items, colour coded by risk
+            for row, (risk, values) in enumerate(items, header_row + 1):
+                ws.set_row(row, 60)
+                ws.write_row(row, 0, values, risk_formats.get(risk, cell_format))
+
+            wb.close()
+
+    def _write_poam_openpyxl(
+        self, items: Iterable[Tuple[str, Tuple]], now: datetime, output_path: str
+    ) -> None:
+        """Write the POAM sheet through openpyxl's write-only mode"""
+        wb = self._new_openpyxl_workbook(write_only=True)
+        self._register_poam_styles(wb)
+        ws = wb.create_sheet("POAM")
+
+        # Write-only rows stream straight to disk, so column widths and row
+        # heights must be set before the rows they apply to are appended
+        self._apply_schema_widths(ws)
 
         # Add classification header
-        ws.cell(
-            row=1, column=1, value="***** UNCLASSIFIED//FOR OFFICIAL USE ONLY *****"
+        ws.append(
+            self._styled_cells(
+                ws,
+                ("***** UNCLASSIFIED//FOR OFFICIAL USE ONLY *****",),
+                font=self._BANNER_FONT,
+                alignment=self._BANNER_ALIGNMENT,
+            )
         )
-        ws.merge_cells("A1:P1")
-        ws.cell(row=1, column=1).font = Font(bold=True, color="FF0000")
-        ws.cell(row=1, column=1).alignment = Alignment(horizontal="center")
+        ws.merged_cells.add("A1:P1")
 
         # Add metadata
-        ws.cell(row=2, column=1, value="Date Exported:")
-        ws.cell(row=2, column=2, value=datetime.now().strftime("%Y-%m-%d"))
-        ws.cell(row=3, column=1, value="Information System:")
-        ws.cell(row=3, column=2, value="[Enter System Name]")
-        ws.cell(row=4, column=1, value="POAM Coordinator:")
-        ws.cell(row=4, column=2, value="[Enter Name]")
-
-        # POAM headers (eMASS standard columns)
-        headers = [
-            "POAM ID",
-            "Control ID",
-            "Weakness Name",
-            "Weakness Description",
-            "Point of Contact",
-            "Resources Required",
-            "Scheduled Completion Date",
-            "Milestone",
-            "Milestone Date",
-            "Risk",
-            "Status",
-            "Comments",
-            "Raw Severity",
-            "Plugin ID",
-            "Affected Hosts",
-            "Remediation",
-        ]
+        ws.append(("Date Exported:", now.strftime("%Y-%m-%d")))
+        ws.append(("Information System:", "[Enter System Name]"))
+        ws.append(("POAM Coordinator:", "[Enter Name]"))
+        ws.append(())
 
         # Write headers
         header_row = 6
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=header_row, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(
-                start_color="366092", end_color="366092", fill_type="solid"
-            )
-            cell.alignment = Alignment(
-                horizontal="center", vertical="center", wrap_text=True
-            )
-            cell.border = Border(
-                left=Side(style="thin"),
-                right=Side(style="thin"),
-                top=Side(style="thin"),
-                bottom=Side(style="thin"),
+        ws.row_dimensions[header_row].height = 40
+        ws.append(self._styled_cells(ws, _POAM_HEADERS, style="poam_header"))
+
+        # Write POAM items, colour coded by risk
+        for row, (risk, values) in enumerate(items, header_row + 1):
+            ws.row_dimensions[row].height = 60
+            ws.append(
+                self._styled_cells(
+                    ws, values, style=_POAM_RISK_STYLES.get(risk, "poam_cell")
+                )
             )
 
-        # Get vulnerability data
-        report = analysis_data.get("report")
-        host_summaries = analysis_data.get("host_summaries", [])
-
-        # Group vulnerabilities by plugin_id to avoid duplicates
-        vuln_groups = {}
-        for host_summary in host_summaries:
-            if report and hasattr(report, "hosts"):
-                for host in report.hosts:
-                    if (
-                        host.name == host_summary.ip
-                        or host.properties.hostname == host_summary.hostname
-                    ):
-                        for vuln in host.vulnerabilities:
-                            # Only include Cat I, II, III (severity 2, 3, 4)
-                            if vuln.severity >= 2:
-                                if vuln.plugin_id not in vuln_groups:
-                                    vuln_groups[vuln.plugin_id] = {
-                                        "vuln": vuln,
-                                        "affected_hosts": [],
-                                    }
-                                vuln_groups[vuln.plugin_id]["affected_hosts"].append(
-                                    f"{host_summary.hostname} ({host_summary.ip})"
-                                )
-
-        # Write POAM items
-        row = header_row + 1
-        poam_id = 1
-
-        for plugin_id, data in sorted(
-            vuln_groups.items(), key=lambda x: -x[1]["vuln"].severity
-        ):
-            vuln = data["vuln"]
-            affected_hosts = data["affected_hosts"]
-
-            # Determine risk category based on severity
-            if vuln.severity == 4:
-                risk = "Very High"
-                cat = "I"
-                completion_days = 15
-            elif vuln.severity == 3:
-                risk = "High"
-                cat = "II"
-                completion_days = 30
-            elif vuln.severity == 2:
-                risk = "Moderate"
-                cat = "III"
-                completion_days = 90
-            else:
-                risk = "Low"
-                cat = "III"
-                completion_days = 180
-
-            # Calculate scheduled completion date
-            from datetime import timedelta
-
-            scheduled_date = (
-                datetime.now() + timedelta(days=completion_days)
-            ).strftime("%Y-%m-%d")
-
-            # Extract CVE/Control mapping (simplified)
-            control_id = vuln.cve if vuln.cve else f"V-{plugin_id}"
-
-            # Write POAM row
-            ws.cell(row=row, column=1, value=f"POAM-{poam_id:04d}")
-            ws.cell(row=row, column=2, value=control_id)
-            ws.cell(row=row, column=3, value=vuln.plugin_name)
-            ws.cell(
-                row=row,
-                column=4,
-                value=(
-                    vuln.description[:500] + "..."
-                    if len(vuln.description) > 500
-                    else vuln.description
-                ),
-            )
-            ws.cell(row=row, column=5, value="[Enter POC]")
-            ws.cell(row=row, column=6, value="Staff time, patch management")
-            ws.cell(row=row, column=7, value=scheduled_date)
-            ws.cell(row=row, column=8, value=f"Remediate Cat {cat} finding")
-            ws.cell(row=row, column=9, value=scheduled_date)
-            ws.cell(row=row, column=10, value=risk)
-            ws.cell(row=row, column=11, value="Open")
-            ws.cell(
-                row=row,
-                column=12,
-                value=f"Identified via Nessus scan. {len(affected_hosts)} host(s) affected.",
-            )
-            ws.cell(row=row, column=13, value=f"CAT {cat}")
-            ws.cell(row=row, column=14, value=plugin_id)
-            ws.cell(
-                row=row,
-                column=15,
-                value="\n".join(affected_hosts[:5])
-                + ("..." if len(affected_hosts) > 5 else ""),
-            )
-            ws.cell(
-                row=row,
-                column=16,
-                value=(
-                    vuln.solution[:300] + "..."
-                    if len(vuln.solution) > 300
-                    else vuln.solution
-                ),
-            )
+        self._save(wb, output_path)
 
-            # Apply formatting
-            for col in range(1, 17):
-                cell = ws.cell(row=row, column=col)
-                cell.alignment = Alignment(vertical="top", wrap_text=True)
-                cell.border = Border(
-                    left=Side(style="thin"),
-                    right=Side(style="thin"),
-                    top=Side(style="thin"),
-                    bottom=Side(style="thin"),
-                )
+    def export_all(self, analysis_data: Dict[str, Any], out_dir: str) -> Dict[str, str]:
+        """
+        Export every Excel report into out_dir on a pool of threads.
 
-                # Color code by risk
-                if risk == "Very High":
-                    cell.fill = PatternFill(
-                        start_color="FFC7CE", end_color="FFC7CE", fill_type="solid"
-                    )
-                elif risk == "High":
-                    cell.fill = PatternFill(
-                        start_color="FFEB9C", end_color="FFEB9C", fill_type="solid"
-                    )
-
-            row += 1
-            poam_id += 1
-
-        # Auto-adjust column widths
-        column_widths = [12, 15, 30, 40, 20, 25, 15, 25, 15, 12, 12, 40, 12, 12, 30, 40]
-        for i, width in enumerate(column_widths, 1):
-            ws.column_dimensions[chr(64 + i)].width = width
-
-        # Set row heights
-        ws.row_dimensions[header_row].height = 40
-        for r in range(header_row + 1, row):
-            ws.row_dimensions[r].height = 60
+        Each report writes its own file, so wall time is close to that of the
+        slowest report rather than the sum of all of them. The openpyxl
+        styles are registered before the threads start; after that the
+        reports only read analysis_data and self.timestamp.
 
-        wb.save(output_path)
-        return output_path
+        Args:
+            analysis_data: Processed vulnerability data with "report" attached
+            out_dir: Directory the workbooks are written to
+
+        Returns:
+            Output path per report, keyed by report name
+        """
+        self._load_openpyxl_styles()
+
+        with ThreadPoolExecutor(max_workers=len(_EXPORT_ALL_TARGETS)) as executor:
+            futures = {
+                name: executor.submit(
+                    getattr(self, method),
+                    analysis_data,
+                    os.path.join(out_dir, file_name.format(self.timestamp)),
+                )
+                for name, method, file_name in _EXPORT_ALL_TARGETS
+            }
+            return {name: future.result() for name, future in futures.items()}
 
 
 def export_excel_vulnerability_report(
@@ -943,3 +1065,25 @@ def export_excel_poam(analysis_data: Dict[str, Any], output_path: str = None) ->
     """Export POAM (Plan of Action & Milestones) as Excel file"""
     exporter = ExcelExporter()
     return exporter.export_poam(analysis_data, output_path)
+
+
+# Reports written by export_all: report name, ExcelExporter method and the
+# file name within out_dir
+_EXPORT_ALL_TARGETS = (
+    (
+        "vulnerability",
+        "export_vulnerability_report",
+        "vISSM_Vulnerability_Report_{}.xlsx",
+    ),
+    ("ivv", "export_ivv_test_plan", "vISSM_IV&V_Test_Plan_{}.xlsx"),
+    ("cnet", "export_cnet_report", "vISSM_CET_Report_{}.xlsx"),
+    ("hw_sw", "export_hw_sw_inventory", "vISSM_Detailed_Inventory_{}.xlsx"),
+    ("emass", "export_emass_inventory", "vISSM_eMASS_Inventory_{}.xlsm"),
+    ("poam", "export_poam", "POAM_{}.xlsx"),
+)
+
+
+def export_all(analysis_data: Dict[str, Any], out_dir: str) -> Dict[str, str]:
+    """Export every Excel report into out_dir, keyed by report name"""
+    exporter = ExcelExporter()
+    return exporter.export_all(analysis_data, out_dir)
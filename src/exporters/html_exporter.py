@@ -5,7 +5,11 @@ Exports vulnerability reports to HTML format
 
 import os
 from typing import Dict, Any
-from src.templates.template_engine import render_html_report
+from src.templates.template_engine import (
+    render_html_report,
+    render_html_report_stream,
+)
+from ._util import _open_output
 
 
 class HTMLExporter:
@@ -17,17 +21,21 @@ class HTMLExporter:
     def export(self, analysis_data: Dict[str, Any], output_path: str) -> str:
         """Export analysis data to HTML file"""
         try:
-            # Render the HTML report
-            html_content = render_html_report(analysis_data, self.template_dir)
-
-            # Ensure output directory exists
-            output_dir = os.path.dirname(output_path)
-            if output_dir:
-                os.makedirs(output_dir, exist_ok=True)
-
-            # Write to file
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(html_content)
+            # Render the HTML report straight into a 1 MiB write buffer, so
+            # the full page is never held in memory at once. Chunks go to a
+            # temporary file beside the output that only replaces it once
+            # rendering has finished, so a failure never leaves a partial page
+            chunks = render_html_report_stream(analysis_data, self.template_dir)
+            temp_path = f"{output_path}.{os.getpid()}.tmp"
+            try:
+                with _open_output(temp_path) as f:
+                    for chunk in chunks:
+                        f.write(chunk.encode("utf-8"))
+                os.replace(temp_path, output_path)
+            except BaseException:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
 
             return output_path
 
@@ -4,9 +4,27 @@ Exports vulnerability reports to PDF format using WeasyPrint
 """
 
 import os
+import threading
 from typing import Dict, Any
 from src.templates.template_engine import render_pdf_report
 
+# WeasyPrint font configuration shared by every export in the process;
+# building one scans the system fonts, which dominates small PDF exports
+_FONT_CONFIG = None
+_FONT_CONFIG_LOCK = threading.Lock()
+
+
+def _get_font_config():
+    """Return the shared FontConfiguration, creating it on first use"""
+    global _FONT_CONFIG
+    if _FONT_CONFIG is None:
+        with _FONT_CONFIG_LOCK:
+            if _FONT_CONFIG is None:
+                from weasyprint.text.fonts import FontConfiguration
+
+                _FONT_CONFIG = FontConfiguration()
+    return _FONT_CONFIG
+
 
 class PDFExporter:
     """Exports vulnerability reports to PDF format"""
@@ -23,7 +41,6 @@ class PDFExporter:
             # Try to use WeasyPrint if available
             try:
                 from weasyprint import HTML
-                from weasyprint.text.fonts import FontConfiguration
 
                 # Ensure output directory exists
                 output_dir = os.path.dirname(output_path)
@@ -31,9 +48,8 @@ class PDFExporter:
                     os.makedirs(output_dir, exist_ok=True)
 
                 # Convert HTML to PDF
-                font_config = FontConfiguration()
                 html_doc = HTML(string=html_content)
-                html_doc.write_pdf(output_path, font_config=font_config)
+                html_doc.write_pdf(output_path, font_config=_get_font_config())
 
             except ImportError:
                 # Fallback: save as HTML that can be printed to PDF
@@ -3,15 +3,43 @@ Nessus XML Parser for vISSM
 Parses .nessus files and extracts vulnerability data
 """
 
+import gzip
 import xml.etree.ElementTree as ET
 from typing import List, Dict
 from dataclasses import dataclass
 
+# HostProperties <tag name="..."> values and the HostProperties field each fills
+_HOST_PROP_ATTRS = {
+    "host-ip": "ip",
+    "hostname": "hostname",
+    "operating-system": "os",
+    "mac-address": "mac_address",
+    "netbios-name": "netbios_name",
+    "fqdn": "fqdn",
+    "HOST_START": "scan_start",
+    "HOST_END": "scan_end",
+}
+
+# The dataclasses below declare __slots__ by hand (dataclass(slots=True) needs
+# Python 3.10) so each instance carries no __dict__; a report holds one
+# Vulnerability per finding. Nothing may set attributes beyond the fields.
+
 
 @dataclass
 class HostProperties:
     """Host properties from Nessus scan"""
 
+    __slots__ = (
+        "hostname",
+        "ip",
+        "os",
+        "mac_address",
+        "netbios_name",
+        "fqdn",
+        "scan_start",
+        "scan_end",
+    )
+
     hostname: str
     ip: str
     os: str
@@ -26,6 +54,23 @@ class HostProperties:
 class Vulnerability:
     """Individual vulnerability finding"""
 
+    __slots__ = (
+        "plugin_id",
+        "plugin_name",
+        "plugin_family",
+        "severity",
+        "description",
+        "solution",
+        "see_also",
+        "cve",
+        "cvss_base_score",
+        "cvss_vector",
+        "port",
+        "protocol",
+        "service_name",
+        "plugin_output",
+    )
+
     plugin_id: str
     plugin_name: str
     plugin_family: str
@@ -34,7 +79,7 @@ class Vulnerability:
     solution: str
     see_also: str
     cve: str
-    cvss_base_score: str
+    cvss_base_score: float
     cvss_vector: str
     port: str
     protocol: str
@@ -46,6 +91,12 @@ class Vulnerability:
 class ReportHost:
     """Host with vulnerabilities"""
 
+    __slots__ = (
+        "name",
+        "properties",
+        "vulnerabilities",
+    )
+
     name: str
     properties: HostProperties
     vulnerabilities: List[Vulnerability]
@@ -55,6 +106,16 @@ class ReportHost:
 class NessusReport:
     """Complete Nessus scan report"""
 
+    __slots__ = (
+        "policy_name",
+        "scan_name",
+        "scan_start",
+        "scan_end",
+        "hosts",
+        "total_hosts",
+        "total_vulnerabilities",
+    )
+
     policy_name: str
     scan_name: str
     scan_start: str
@@ -69,27 +130,66 @@ class NessusParser:
 
     def __init__(self, file_path: str):
         self.file_path = file_path
-        self.tree = None
         self.root = None
+        # Distinct finding strings seen during the current parse
+        self._strings: Dict[str, str] = {}
 
     def parse(self) -> NessusReport:
-        """Parse the Nessus file and return structured data"""
+        """
+        Parse the Nessus file and return structured data.
+
+        Gzip-compressed scans (.nessus.gz) are decompressed as they are read.
+        The file is read in one streaming pass: each ReportHost is converted
+        as soon as it closes and its elements are then discarded, so peak
+        memory holds one host's XML rather than the whole document.
+        """
         try:
-            self.tree = ET.parse(self.file_path)
-            self.root = self.tree.getroot()
-
-            # Extract policy information
-            policy_name = self._extract_policy_name()
-            scan_info = self._extract_scan_info()
-
-            # Parse all hosts
-            hosts = self._parse_hosts()
+            self.root = None
+            self._strings = {}
+            policy_name = None
+            scan_info = {}
+            hosts = []
+
+            # Open elements from the root down; the last entry is the parent
+            # of the element being closed
+            open_elems = []
+            with self._open_source() as source:
+                for event, elem in ET.iterparse(source, events=("start", "end")):
+                    if event == "start":
+                        if self.root is None:
+                            self.root = elem
+                        open_elems.append(elem)
+                        continue
+
+                    open_elems.pop()
+                    tag = elem.tag
+
+                    if tag == "ReportHost":
+                        hosts.append(self._parse_host(elem))
+                        # Drop the finished host so the tree never accumulates
+                        elem.clear()
+                        if open_elems:
+                            open_elems[-1].remove(elem)
+                    elif tag == "policyName":
+                        # Extract policy information
+                        if (
+                            policy_name is None
+                            and open_elems
+                            and open_elems[-1].tag == "Policy"
+                        ):
+                            policy_name = elem.text or "Unknown Policy"
+                    elif tag == "preference":
+                        if "name" not in scan_info and elem.get("name") == "TARGET":
+                            scan_info.update(self._extract_scan_info(elem))
+
+            # The findings hold the shared strings; the lookup table can go
+            self._strings = {}
 
             # Calculate totals
             total_vulnerabilities = sum(len(host.vulnerabilities) for host in hosts)
 
             return NessusReport(
-                policy_name=policy_name,
+                policy_name=policy_name or "Unknown Policy",
                 scan_name=scan_info.get("name", "Unknown Scan"),
                 scan_start=scan_info.get("start", ""),
                 scan_end=scan_info.get("end", ""),
@@ -103,50 +203,32 @@ class NessusParser:
         except Exception as e:
             raise ValueError(f"Error parsing Nessus file: {e}")
 
-    def _extract_policy_name(self) -> str:
-        """Extract policy name from the file"""
-        policy_elem = self.root.find(".//Policy/policyName")
-        if policy_elem is not None:
-            return policy_elem.text or "Unknown Policy"
-        return "Unknown Policy"
-
-    def _extract_scan_info(self) -> Dict[str, str]:
-        """Extract scan information"""
-        info = {}
-
-        # Look for scan start/end times
-        start_elem = self.root.find('.//preference[@name="TARGET"]')
-        if start_elem is not None:
-            info["name"] = (
-                start_elem.find("value").text
-                if start_elem.find("value") is not None
-                else "Unknown"
-            )
-
-        return info
-
-    def _parse_hosts(self) -> List[ReportHost]:
-        """Parse all ReportHost elements"""
-        hosts = []
+    def _open_source(self):
+        """Open the scan file for reading, decompressing .gz files on the fly"""
+        if self.file_path.endswith(".gz"):
+            return gzip.open(self.file_path, "rb")
+        return open(self.file_path, "rb")
 
-        for host_elem in self.root.findall(".//ReportHost"):
-            host_name = host_elem.get("name", "Unknown")
+    def _extract_scan_info(self, target_elem) -> Dict[str, str]:
+        """Extract scan information from the TARGET preference"""
+        value_elem = target_elem.find("value")
+        return {"name": value_elem.text if value_elem is not None else "Unknown"}
 
-            # Parse host properties
-            properties = self._parse_host_properties(host_elem)
+    def _parse_host(self, host_elem) -> ReportHost:
+        """Parse one completed ReportHost element"""
+        host_name = host_elem.get("name", "Unknown")
 
-            # Parse vulnerabilities for this host
-            vulnerabilities = self._parse_host_vulnerabilities(host_elem)
+        # Parse host properties
+        properties = self._parse_host_properties(host_elem)
 
-            hosts.append(
-                ReportHost(
-                    name=host_name,
-                    properties=properties,
-                    vulnerabilities=vulnerabilities,
-                )
-            )
+        # Parse vulnerabilities for this host
+        vulnerabilities = self._parse_host_vulnerabilities(host_elem)
 
-        return hosts
+        return ReportHost(
+            name=host_name,
+            properties=properties,
+            vulnerabilities=vulnerabilities,
+        )
 
     def _parse_host_properties(self, host_elem) -> HostProperties:
         """Parse host properties from ReportHost"""
@@ -166,26 +248,17 @@ class NessusParser:
 
         host_props = host_elem.find("HostProperties")
         if host_props is not None:
-            for tag in host_props.findall("tag"):
-                name = tag.get("name", "")
-                value = tag.text or ""
-
-                if name == "host-ip":
-                    props.ip = value  # Prefer host-ip tag if available
-                elif name == "hostname":
-                    props.hostname = value
-                elif name == "operating-system":
-                    props.os = value
-                elif name == "mac-address":
-                    props.mac_address = value
-                elif name == "netbios-name":
-                    props.netbios_name = value
-                elif name == "fqdn":
-                    props.fqdn = value
-                elif name == "HOST_START":
-                    props.scan_start = value
-                elif name == "HOST_END":
-                    props.scan_end = value
+            # Hosts carry many more tags than the fields kept here, so stop
+            # reading once every field has been found
+            filled = set()
+            for tag in host_props.iterfind("tag"):
+                # host-ip overrides the IP taken from the host element name
+                attr = _HOST_PROP_ATTRS.get(tag.get("name"))
+                if attr is not None:
+                    setattr(props, attr, tag.text or "")
+                    filled.add(attr)
+                    if len(filled) == len(_HOST_PROP_ATTRS):
+                        break
 
         return props
 
@@ -193,27 +266,49 @@ class NessusParser:
         """Parse vulnerabilities for a specific host"""
         vulnerabilities = []
 
-        for item in host_elem.findall(".//ReportItem"):
+        # Plugin metadata repeats on every host a plugin fires on; keep one
+        # string object per distinct value instead of one per finding
+        share = self._share
+
+        for item in host_elem.iter("ReportItem"):
             vuln = Vulnerability(
-                plugin_id=item.get("pluginID", ""),
-                plugin_name=item.get("pluginName", ""),
-                plugin_family=item.get("pluginFamily", ""),
+                plugin_id=share(item.get("pluginID", "")),
+                plugin_name=share(item.get("pluginName", "")),
+                plugin_family=share(item.get("pluginFamily", "")),
                 severity=int(item.get("severity", "0")),
-                description=self._get_text(item, "description"),
-                solution=self._get_text(item, "solution"),
-                see_also=self._get_text(item, "see_also"),
-                cve=self._get_text(item, "cve"),
-                cvss_base_score=self._get_text(item, "cvss_base_score"),
-                cvss_vector=self._get_text(item, "cvss_vector"),
-                port=item.get("port", ""),
-                protocol=item.get("protocol", ""),
-                service_name=item.get("svc_name", ""),
+                description=share(self._get_text(item, "description")),
+                solution=share(self._get_text(item, "solution")),
+                see_also=share(self._get_text(item, "see_also")),
+                cve=share(self._get_text(item, "cve")),
+                cvss_base_score=self._get_score(item, "cvss_base_score"),
+                cvss_vector=share(self._get_text(item, "cvss_vector")),
+                port=share(item.get("port", "")),
+                protocol=share(item.get("protocol", "")),
+                service_name=share(item.get("svc_name", "")),
                 plugin_output=self._get_text(item, "plugin_output"),
             )
             vulnerabilities.append(vuln)
 
         return vulnerabilities
 
+    def _share(self, value: str) -> str:
+        """Return the canonical copy of value for the current parse"""
+        return self._strings.setdefault(value, value)
+
+    def _get_score(self, element, tag_name: str) -> float:
+        """
+        Read a numeric score from an XML element.
+
+        Converted once here so sorting and filtering by score never re-parse
+        the text. 0.0 stands in for a missing, blank or malformed score, so
+        one bad value does not fail the whole file.
+        """
+        text = (self._get_text(element, tag_name) or "").strip()
+        try:
+            return float(text) if text else 0.0
+        except ValueError:
+            return 0.0
+
     def _get_text(self, element, tag_name: str) -> str:
         """Safely get text content from XML element"""
         elem = element.find(tag_name)
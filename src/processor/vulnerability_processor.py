@@ -3,7 +3,7 @@ Vulnerability Data Processor for vISSM
 Processes and categorizes vulnerability data from Nessus reports
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Tuple
 from dataclasses import dataclass
 from collections import defaultdict
 from src.parser.nessus_parser import NessusReport, Vulnerability
@@ -329,6 +329,42 @@ def process_nessus_report(report: NessusReport) -> Dict[str, Any]:
     return processor.process()
 
 
+def match_host_summaries(
+    report: NessusReport, host_summaries: List[HostSummary]
+) -> Iterator[Tuple[HostSummary, Any]]:
+    """
+    Pair each host summary with its report host.
+
+    Hosts are indexed by IP and by hostname once, so matching is a dict
+    lookup per summary instead of a scan over every host. Every exporter
+    goes through this, so all report formats list the same hosts.
+
+    Yields:
+        (host_summary, host) tuples in host summary order, each host once
+    """
+    # Nothing can match without report hosts or summaries; skip the indexing
+    if not (host_summaries and report and hasattr(report, "hosts")):
+        return
+
+    host_by_ip = {}
+    host_by_hostname = {}
+    for host in report.hosts:
+        host_by_ip.setdefault(host.name, host)
+        if host.properties.hostname:
+            host_by_hostname.setdefault(host.properties.hostname, host)
+
+    # A host is emitted once even if several summaries resolve to it
+    seen_host_ids = set()
+    for host_summary in host_summaries:
+        host = host_by_ip.get(host_summary.ip) or host_by_hostname.get(
+            host_summary.hostname
+        )
+        if host is None or id(host) in seen_host_ids:
+            continue
+        seen_host_ids.add(id(host))
+        yield host_summary, host
+
+
 if __name__ == "__main__":
     # Test the processor
     import sys
@@ -4,9 +4,172 @@ Handles template rendering for various output formats
 """
 
 import os
-from typing import Dict, Any
-from jinja2 import Environment, FileSystemLoader, Template
+import re
+from html import escape
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Optional, TextIO
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template,
+    TemplateNotFound,
+    select_autoescape,
+)
 from datetime import datetime
+from src.processor.vulnerability_processor import match_host_summaries
+
+# Most compiled render_string templates kept per engine
+STRING_TEMPLATE_CACHE_SIZE = 64
+
+# Environment variable naming the directory for compiled template bytecode;
+# when unset, Jinja's per-user cache directory under the temp dir is used
+BYTECODE_CACHE_ENV = "VISSM_JINJA_CACHE"
+
+
+def _bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """
+    Build the on-disk bytecode cache shared by every run of the tool.
+
+    Returns None, so templates are simply compiled in memory, when the cache
+    directory cannot be created or is unsafe to use (read-only or locked-down
+    temp dir, or a default directory owned by another user).
+    """
+    cache_dir = os.environ.get(BYTECODE_CACHE_ENV) or None
+    try:
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+        return FileSystemBytecodeCache(cache_dir, "%s.cache")
+    except (OSError, RuntimeError):
+        return None
+
+
+# Severity number -> display name, shared by the filters and inline report
+_SEVERITY_NAMES = {0: "Info", 1: "Low", 2: "Medium", 3: "High", 4: "Critical"}
+
+# Risk score bands: a score at or above _RISK_THRESHOLDS[i] is _RISK_LABELS[i + 1]
+_RISK_THRESHOLDS = (20, 40, 60, 80)
+_RISK_LABELS = ("Minimal", "Low", "Medium", "High", "Critical")
+
+
+def _escape_text(value: Optional[str], default: str = "") -> str:
+    """HTML-escape a scan field, using default when it is missing or empty"""
+    # Empty XML elements (<cve/>) reach the report as None, not ""
+    return escape(value or "") or default
+
+
+def _severity_name_filter(severity: int) -> str:
+    """Convert severity number to name"""
+    return _SEVERITY_NAMES.get(severity, "Unknown")
+
+
+def _risk_level_filter(risk_score: float) -> str:
+    """Convert risk score to risk level"""
+    return _RISK_LABELS[bisect_right(_RISK_THRESHOLDS, risk_score)]
+
+
+# Accepted date formats, each behind a pattern that recognises its shape so
+# only the matching format is handed to strptime
+_DATE_FORMATS = (
+    (
+        re.compile(r"\d{4}-\d{1,2}-\d{1,2}\s+\d{1,2}:\d{1,2}:\d{1,2}"),
+        "%Y-%m-%d %H:%M:%S",
+    ),
+    (re.compile(r"\d{4}-\d{1,2}-\d{1,2}"), "%Y-%m-%d"),
+    (re.compile(r"\d{1,2}/\d{1,2}/\d{4}"), "%m/%d/%Y"),
+)
+
+
+def _format_date_filter(date_string: str) -> str:
+    """Format date string for display"""
+    if not date_string:
+        return "Unknown"
+    if not isinstance(date_string, str):
+        return date_string
+    return _parse_and_format_date(date_string)
+
+
+@lru_cache(maxsize=4096)
+def _parse_and_format_date(date_string: str) -> str:
+    """
+    Reformat a date string, returning it unchanged if no format matches.
+
+    Reports repeat the same scan timestamps on many rows, so results are
+    cached rather than running strptime for each one.
+    """
+    for pattern, fmt in _DATE_FORMATS:
+        if pattern.fullmatch(date_string):
+            try:
+                dt = datetime.strptime(date_string, fmt)
+            except ValueError:
+                # Right shape, impossible value (e.g. month 13)
+                return date_string
+            return dt.strftime("%B %d, %Y")
+    return date_string
+
+
+# CSS styles for HTML report
+_CSS_STYLES = """
+        <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background: #f4f4f4; padding: 20px; border-radius: 5px; }
+        .summary { display: flex; justify-content: space-around; margin: 20px 0; }
+        .summary-item { text-align: center; padding: 10px; }
+        .critical { color: #d32f2f; font-weight: bold; }
+        .high { color: #f57c00; font-weight: bold; }
+        .medium { color: #fbc02d; font-weight: bold; }
+        .low { color: #388e3c; font-weight: bold; }
+        .info { color: #1976d2; font-weight: bold; }
+        table { width: 100%; border-collapse: collapse; margin: 20px 0; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+        .host-row { background-color: #f9f9f9; }
+        .vuln-row { background-color: #fff; }
+        .severity-critical { background-color: #ffebee; }
+        .severity-high { background-color: #fff3e0; }
+        .severity-medium { background-color: #fffde7; }
+        .severity-low { background-color: #e8f5e8; }
+        .severity-info { background-color: #e3f2fd; }
+        </style>
+        """
+
+
+# JavaScript for HTML report
+_JAVASCRIPT = """
+        <script>
+        function toggleVulnerabilities(hostId) {
+            var vulns = document.getElementById('vulns-' + hostId);
+            if (vulns.style.display === 'none') {
+                vulns.style.display = 'block';
+            } else {
+                vulns.style.display = 'none';
+            }
+        }
+        </script>
+        """
+
+
+# Styles optimized for PDF generation
+_PDF_STYLES = """
+        <style>
+        @page { size: A4; margin: 2cm; }
+        body { font-family: 'Times New Roman', serif; font-size: 12px; line-height: 1.4; }
+        .header { text-align: center; margin-bottom: 30px; }
+        .summary { display: table; width: 100%; margin: 20px 0; }
+        .summary-item { display: table-cell; text-align: center; padding: 10px; }
+        .critical { color: #d32f2f; font-weight: bold; }
+        .high { color: #f57c00; font-weight: bold; }
+        .medium { color: #fbc02d; font-weight: bold; }
+        .low { color: #388e3c; font-weight: bold; }
+        .info { color: #1976d2; font-weight: bold; }
+        table { width: 100%; border-collapse: collapse; margin: 10px 0; page-break-inside: avoid; }
+        th, td { border: 1px solid #000; padding: 5px; font-size: 10px; }
+        th { background-color: #f0f0f0; font-weight: bold; }
+        .page-break { page-break-before: always; }
+        </style>
+        """
 
 
 class TemplateEngine:
@@ -19,15 +182,37 @@ class TemplateEngine:
         self.template_dir = template_dir
         self.env = Environment(
             loader=FileSystemLoader(template_dir),
-            autoescape=True,
+            # Escape HTML/XML templates and string templates; other file
+            # types (plain text, CSV) render values without escape calls
+            autoescape=select_autoescape(
+                enabled_extensions=("html", "htm", "xml"), default_for_string=True
+            ),
             trim_blocks=True,
             lstrip_blocks=True,
+            # Persist compiled templates so later runs skip parsing them
+            bytecode_cache=_bytecode_cache(),
+            # Templates don't change while a report run is in progress, so
+            # cached templates are reused without an mtime check per render
+            auto_reload=False,
         )
 
         # Add custom filters
-        self.env.filters["severity_name"] = self._severity_name_filter
-        self.env.filters["risk_level"] = self._risk_level_filter
-        self.env.filters["format_date"] = self._format_date_filter
+        self.env.filters["severity_name"] = _severity_name_filter
+        self.env.filters["risk_level"] = _risk_level_filter
+        self.env.filters["format_date"] = _format_date_filter
+
+        # Compiled render_string templates, keyed by their source text and
+        # kept in least-recently-used order
+        self._string_templates: "OrderedDict[str, Template]" = OrderedDict()
+
+    def preload_templates(self, template_names) -> None:
+        """Compile the named templates into the environment cache up front"""
+        for template_name in template_names:
+            try:
+                self.env.get_template(template_name)
+            except TemplateNotFound:
+                # Missing templates fail at render time with a clear error
+                continue
 
     def render_template(self, template_name: str, data: Dict[str, Any]) -> str:
         """Render a template with the provided data"""
@@ -40,46 +225,20 @@ class TemplateEngine:
     def render_string(self, template_string: str, data: Dict[str, Any]) -> str:
         """Render a template string with the provided data"""
         try:
-            template = Template(template_string)
+            template = self._string_templates.get(template_string)
+            if template is None:
+                # from_string compiles on every call; keep the result so a
+                # repeated string is only compiled once per engine
+                template = self.env.from_string(template_string)
+                self._string_templates[template_string] = template
+                if len(self._string_templates) > STRING_TEMPLATE_CACHE_SIZE:
+                    self._string_templates.popitem(last=False)
+            else:
+                self._string_templates.move_to_end(template_string)
             return template.render(**data)
         except Exception as e:
             raise ValueError(f"Error rendering template string: {e}")
 
-    def _severity_name_filter(self, severity: int) -> str:
-        """Convert severity number to name"""
-        severity_names = {0: "Info", 1: "Low", 2: "Medium", 3: "High", 4: "Critical"}
-        return severity_names.get(severity, "Unknown")
-
-    def _risk_level_filter(self, risk_score: float) -> str:
-        """Convert risk score to risk level"""
-        if risk_score >= 80:
-            return "Critical"
-        elif risk_score >= 60:
-            return "High"
-        elif risk_score >= 40:
-            return "Medium"
-        elif risk_score >= 20:
-            return "Low"
-        else:
-            return "Minimal"
-
-    def _format_date_filter(self, date_string: str) -> str:
-        """Format date string for display"""
-        if not date_string:
-            return "Unknown"
-
-        try:
-            # Try to parse common date formats
-            for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%m/%d/%Y"]:
-                try:
-                    dt = datetime.strptime(date_string, fmt)
-                    return dt.strftime("%B %d, %Y")
-                except ValueError:
-                    continue
-            return date_string
-        except Exception:
-            return date_string
-
 
 class ReportTemplate:
     """Base class for report templates"""
@@ -104,6 +263,21 @@ class ReportTemplate:
             data["medium_count"] = summary.medium_count
             data["low_count"] = summary.low_count
             data["info_count"] = summary.info_count
+        elif hasattr(data.get("report"), "hosts"):
+            # No processed summary: count severities in one pass instead
+            counts = [0] * 5
+            for host in data["report"].hosts:
+                for vuln in host.vulnerabilities:
+                    if 0 <= vuln.severity <= 4:
+                        counts[vuln.severity] += 1
+
+            data["total_hosts"] = len(data["report"].hosts)
+            data["total_vulnerabilities"] = sum(counts)
+            data["critical_count"] = counts[4]
+            data["high_count"] = counts[3]
+            data["medium_count"] = counts[2]
+            data["low_count"] = counts[1]
+            data["info_count"] = counts[0]
 
         return data
 
@@ -113,60 +287,25 @@ class HTMLReportTemplate(ReportTemplate):
 
     def render(self, analysis_data: Dict[str, Any]) -> str:
         """Render HTML report"""
+        return "".join(self.stream(analysis_data))
+
+    def stream(self, analysis_data: Dict[str, Any]) -> Iterator[str]:
+        """Render HTML report as a sequence of chunks, without joining them"""
         data = self.prepare_data(analysis_data)
 
         # Add HTML-specific data
-        data["css_styles"] = self._get_css_styles()
-        data["javascript"] = self._get_javascript()
+        data["css_styles"] = _CSS_STYLES
+        data["javascript"] = _JAVASCRIPT
 
         # Use inline template as fallback if template files don't exist
-        return self._render_inline_html(data)
-
-    def _get_css_styles(self) -> str:
-        """Get CSS styles for HTML report"""
-        return """
-        <style>
-        body { font-family: Arial, sans-serif; margin: 20px; }
-        .header { background: #f4f4f4; padding: 20px; border-radius: 5px; }
-        .summary { display: flex; justify-content: space-around; margin: 20px 0; }
-        .summary-item { text-align: center; padding: 10px; }
-        .critical { color: #d32f2f; font-weight: bold; }
-        .high { color: #f57c00; font-weight: bold; }
-        .medium { color: #fbc02d; font-weight: bold; }
-        .low { color: #388e3c; font-weight: bold; }
-        .info { color: #1976d2; font-weight: bold; }
-        table { width: 100%; border-collapse: collapse; margin: 20px 0; }
-        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
-        th { background-color: #f2f2f2; }
-        .host-row { background-color: #f9f9f9; }
-        .vuln-row { background-color: #fff; }
-        .severity-critical { background-color: #ffebee; }
-        .severity-high { background-color: #fff3e0; }
-        .severity-medium { background-color: #fffde7; }
-        .severity-low { background-color: #e8f5e8; }
-        .severity-info { background-color: #e3f2fd; }
-        </style>
-        """
+        return self._iter_inline_html(data)
 
-    def _get_javascript(self) -> str:
-        """Get JavaScript for HTML report"""
-        return """
-        <script>
-        function toggleVulnerabilities(hostId) {
-            var vulns = document.getElementById('vulns-' + hostId);
-            if (vulns.style.display === 'none') {
-                vulns.style.display = 'block';
-            } else {
-                vulns.style.display = 'none';
-            }
-        }
-        </script>
-        """
-
-    def _render_inline_html(self, data: Dict[str, Any]) -> str:
-        """Render HTML report using inline template"""
+    def _iter_inline_html(self, data: Dict[str, Any]) -> Iterator[str]:
+        """Yield the inline-template HTML report a section or row at a time"""
+        # Scan data is untrusted text (plugin names carry angle brackets and
+        # quotes), so every string field is escaped before it is emitted
         host_summaries = data.get("host_summaries", [])
-        html = f"""
+        yield f"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -229,11 +368,11 @@ class HTMLReportTemplate(ReportTemplate):
 """
 
         for host in host_summaries:
-            html += f"""
+            yield f"""
         <tr class="host-row">
-            <td>{host.hostname or 'N/A'}</td>
-            <td>{host.ip}</td>
-            <td>{host.os or 'Unknown'}</td>
+            <td>{_escape_text(host.hostname, 'N/A')}</td>
+            <td>{_escape_text(host.ip)}</td>
+            <td>{_escape_text(host.os, 'Unknown')}</td>
             <td>{host.total_vulnerabilities}</td>
             <td class="critical">{host.critical_vulnerabilities}</td>
             <td class="high">{host.high_vulnerabilities}</td>
@@ -244,20 +383,20 @@ class HTMLReportTemplate(ReportTemplate):
         </tr>
 """
 
-        html += """
+        yield """
     </table>
 """
 
         # Add detailed vulnerabilities section if report data is available
         report = data.get("report")
         if report and hasattr(report, "hosts"):
-            html += """
+            yield """
     <h2>Detailed Vulnerabilities</h2>
 """
             for host in report.hosts:
                 if host.vulnerabilities:
-                    html += f"""
-    <h3>{host.properties.hostname or host.name}</h3>
+                    yield f"""
+    <h3>{_escape_text(host.properties.hostname or host.name)}</h3>
     <table>
         <tr>
             <th>Plugin ID</th>
@@ -268,101 +407,86 @@ class HTMLReportTemplate(ReportTemplate):
         </tr>
 """
                     for vuln in host.vulnerabilities:
-                        severity_names = {
-                            0: "Info",
-                            1: "Low",
-                            2: "Medium",
-                            3: "High",
-                            4: "Critical",
-                        }
-                        severity_name = severity_names.get(vuln.severity, "Unknown")
+                        severity_name = _SEVERITY_NAMES.get(vuln.severity, "Unknown")
                         severity_class = severity_name.lower()
-                        html += f"""
+                        yield f"""
         <tr class="vuln-row severity-{severity_class}">
-            <td>{vuln.plugin_id}</td>
-            <td>{vuln.plugin_name}</td>
+            <td>{_escape_text(vuln.plugin_id)}</td>
+            <td>{_escape_text(vuln.plugin_name)}</td>
             <td class="{severity_class}">{severity_name}</td>
-            <td>{vuln.port}/{vuln.protocol}</td>
-            <td>{vuln.cve or 'N/A'}</td>
+            <td>{_escape_text(vuln.port)}/{_escape_text(vuln.protocol)}</td>
+            <td>{_escape_text(vuln.cve, 'N/A')}</td>
         </tr>
 """
-                    html += """
+                    yield """
     </table>
 """
 
-        html += """
+        yield """
     <h2>Recommendations</h2>
     <ul>
 """
 
         for rec in data.get("recommendations", []):
-            html += f"        <li>{rec}</li>\n"
+            yield f"        <li>{_escape_text(rec)}</li>\n"
 
-        html += """
+        yield """
     </ul>
 </body>
 </html>
 """
-        return html
 
 
 class PDFReportTemplate(ReportTemplate):
     """PDF report template"""
 
+    # Template file used for each report type
+    TEMPLATE_MAP = {
+        "vulnerability": "pdf_report.html",
+        "ivv-test-plan": "ivv_test_plan.html",
+        "cnet": "cnet_report.html",
+        "hw-sw-inventory": "hw_sw_inventory.html",
+        "emass-inventory": "emass_inventory.html",
+    }
+
     def render(self, analysis_data: Dict[str, Any]) -> str:
         """Render PDF report (HTML that can be converted to PDF)"""
         data = self.prepare_data(analysis_data)
 
         # Add PDF-specific styling
-        data["pdf_styles"] = self._get_pdf_styles()
+        data["pdf_styles"] = _PDF_STYLES
 
         # Select template based on report type
         report_type = analysis_data.get("report_type", "vulnerability")
-        template_map = {
-            "vulnerability": "pdf_report.html",
-            "ivv-test-plan": "ivv_test_plan.html",
-            "cnet": "cnet_report.html",
-            "hw-sw-inventory": "hw_sw_inventory.html",
-            "emass-inventory": "emass_inventory.html",
-        }
-
-        template_name = template_map.get(report_type, "pdf_report.html")
+        template_name = self.TEMPLATE_MAP.get(report_type, "pdf_report.html")
         return self.template_engine.render_template(template_name, data)
 
-    def _get_pdf_styles(self) -> str:
-        """Get styles optimized for PDF generation"""
-        return """
-        <style>
-        @page { size: A4; margin: 2cm; }
-        body { font-family: 'Times New Roman', serif; font-size: 12px; line-height: 1.4; }
-        .header { text-align: center; margin-bottom: 30px; }
-        .summary { display: table; width: 100%; margin: 20px 0; }
-        .summary-item { display: table-cell; text-align: center; padding: 10px; }
-        .critical { color: #d32f2f; font-weight: bold; }
-        .high { color: #f57c00; font-weight: bold; }
-        .medium { color: #fbc02d; font-weight: bold; }
-        .low { color: #388e3c; font-weight: bold; }
-        .info { color: #1976d2; font-weight: bold; }
-        table { width: 100%; border-collapse: collapse; margin: 10px 0; page-break-inside: avoid; }
-        th, td { border: 1px solid #000; padding: 5px; font-size: 10px; }
-        th { background-color: #f0f0f0; font-weight: bold; }
-        .page-break { page-break-before: always; }
-        </style>
-        """
-
 
 class CSVReportTemplate(ReportTemplate):
     """CSV report template"""
 
-    def render(self, analysis_data: Dict[str, Any]) -> str:
-        """Render CSV report"""
+    def __init__(self, template_engine: TemplateEngine = None):
+        # Rows are written with csv.writer, so no Jinja engine is required
+        super().__init__(template_engine)
+
+    def render(
+        self, analysis_data: Dict[str, Any], out: TextIO = None
+    ) -> Optional[str]:
+        """
+        Render CSV report.
+
+        Rows are written straight to out when it is given (open it with
+        newline=""), so the report is never held in memory as one string;
+        None is returned in that case. Without out the CSV text is returned.
+        """
         import csv
         import io
 
         data = self.prepare_data(analysis_data)
 
-        output = io.StringIO()
-        writer = csv.writer(output)
+        output = io.StringIO() if out is None else out
+        # Unix line endings keep the text one byte per row shorter than CRLF
+        writer = csv.writer(output, dialect="unix", quoting=csv.QUOTE_MINIMAL)
 
         # Write header
         writer.writerow(
@@ -381,45 +505,39 @@ class CSVReportTemplate(ReportTemplate):
             ]
         )
 
-        # Write vulnerability data
-        for host_summary in data.get("host_summaries", []):
-            # Find the corresponding host data
-            host_data = None
-            for host in data.get("report", {}).get("hosts", []):
-                if (
-                    host.name == host_summary.ip
-                    or host.properties.hostname == host_summary.hostname
-                ):
-                    host_data = host
-                    break
-
-            if host_data:
+        def rows():
+            pairs = match_host_summaries(
+                data.get("report"), data.get("host_summaries", [])
+            )
+            for host_summary, host_data in pairs:
+                hostname = host_summary.hostname
+                ip = host_summary.ip
+                os_name = host_summary.os
                 for vuln in host_data.vulnerabilities:
-                    writer.writerow(
-                        [
-                            host_summary.hostname,
-                            host_summary.ip,
-                            host_summary.os,
-                            vuln.plugin_id,
-                            vuln.plugin_name,
-                            vuln.severity,
-                            vuln.plugin_family,
-                            vuln.port,
-                            vuln.service_name,
-                            (
-                                vuln.description[:200] + "..."
-                                if len(vuln.description) > 200
-                                else vuln.description
-                            ),
-                            (
-                                vuln.solution[:100] + "..."
-                                if len(vuln.solution) > 100
-                                else vuln.solution
-                            ),
-                        ]
+                    description = vuln.description
+                    solution = vuln.solution
+                    yield (
+                        hostname,
+                        ip,
+                        os_name,
+                        vuln.plugin_id,
+                        vuln.plugin_name,
+                        vuln.severity,
+                        vuln.plugin_family,
+                        vuln.port,
+                        vuln.service_name,
+                        (
+                            description[:200] + "..."
+                            if len(description) > 200
+                            else description
+                        ),
+                        solution[:100] + "..." if len(solution) > 100 else solution,
                     )
 
-        return output.getvalue()
+        # Write vulnerability data; writerows drives the generator from C
+        writer.writerows(rows())
+
+        return output.getvalue() if out is None else None
 
 
 def create_template_engine(template_dir: str = None) -> TemplateEngine:
@@ -427,25 +545,50 @@ def create_template_engine(template_dir: str = None) -> TemplateEngine:
     return TemplateEngine(template_dir)
 
 
+@lru_cache(maxsize=8)
+def _shared_engine(template_dir: str = None) -> TemplateEngine:
+    """
+    Return one TemplateEngine per template directory.
+
+    Reusing the engine keeps Jinja's compiled template cache warm across
+    reports instead of recompiling every template on each render. The
+    report templates are compiled when the engine is first created.
+    """
+    engine = TemplateEngine(template_dir)
+    engine.preload_templates(PDFReportTemplate.TEMPLATE_MAP.values())
+    return engine
+
+
 def render_html_report(analysis_data: Dict[str, Any], template_dir: str = None) -> str:
     """Render HTML vulnerability report"""
-    engine = create_template_engine(template_dir)
-    template = HTMLReportTemplate(engine)
+    template = HTMLReportTemplate(_shared_engine(template_dir))
     return template.render(analysis_data)
 
 
+def render_html_report_stream(
+    analysis_data: Dict[str, Any], template_dir: str = None
+) -> Iterator[str]:
+    """
+    Render HTML vulnerability report as chunks for writing straight to a file.
+
+    Chunks are produced as they are written, so the full text is never held
+    in memory.
+    """
+    template = HTMLReportTemplate(_shared_engine(template_dir))
+    return template.stream(analysis_data)
+
+
 def render_pdf_report(analysis_data: Dict[str, Any], template_dir: str = None) -> str:
     """Render PDF vulnerability report"""
-    engine = create_template_engine(template_dir)
-    template = PDFReportTemplate(engine)
+    template = PDFReportTemplate(_shared_engine(template_dir))
     return template.render(analysis_data)
 
 
-def render_csv_report(analysis_data: Dict[str, Any]) -> str:
-    """Render CSV vulnerability report"""
-    engine = create_template_engine()
-    template = CSVReportTemplate(engine)
-    return template.render(analysis_data)
+def render_csv_report(
+    analysis_data: Dict[str, Any], out: TextIO = None
+) -> Optional[str]:
+    """Render CSV vulnerability report, streaming it to out when given"""
+    return CSVReportTemplate().render(analysis_data, out)
 
 
 if __name__ == "__main__":
@@ -11,6 +11,9 @@ from pathlib import Path
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))  # noqa: E402
 
+# Repository root, where cli.py lives
+REPO_ROOT = os.path.join(os.path.dirname(__file__), "..")
+
 
 class TestVISSM(unittest.TestCase):
     """Test cases for vISSM functionality"""
@@ -23,6 +26,89 @@ class TestVISSM(unittest.TestCase):
         # Create test fixtures directory if it doesn't exist
         self.test_data_dir.mkdir(exist_ok=True)
 
+    def _make_vulnerability(self, **fields):
+        """Build a Vulnerability with test defaults, overriding the given fields"""
+        from parser.nessus_parser import Vulnerability
+
+        values = {
+            "plugin_id": "12345",
+            "plugin_name": "Test Vulnerability",
+            "plugin_family": "Test Family",
+            "severity": 3,
+            "description": "Test description",
+            "solution": "Test solution",
+            "see_also": "",
+            "cve": "CVE-2023-1234",
+            "cvss_base_score": 7.5,
+            "cvss_vector": "",
+            "port": "80",
+            "protocol": "tcp",
+            "service_name": "http",
+            "plugin_output": "",
+        }
+        values.update(fields)
+        return Vulnerability(**values)
+
+    def _make_host(self, vulnerabilities, hostname="test-host", ip="192.168.1.1"):
+        """Build a Windows 10 ReportHost carrying the given vulnerabilities"""
+        from parser.nessus_parser import HostProperties, ReportHost
+
+        props = HostProperties(
+            hostname=hostname,
+            ip=ip,
+            os="Windows 10",
+            mac_address="",
+            netbios_name="",
+            fqdn="",
+            scan_start="",
+            scan_end="",
+        )
+        return ReportHost(
+            name=ip, properties=props, vulnerabilities=list(vulnerabilities)
+        )
+
+    def _make_report(self, hosts):
+        """Build a NessusReport over the given hosts"""
+        from parser.nessus_parser import NessusReport
+
+        return NessusReport(
+            policy_name="Test Policy",
+            scan_name="Test Scan",
+            scan_start="2023-01-01",
+            scan_end="2023-01-01",
+            hosts=hosts,
+            total_hosts=len(hosts),
+            total_vulnerabilities=sum(len(host.vulnerabilities) for host in hosts),
+        )
+
+    def _make_analysis_data(self, report):
+        """Process a report and attach it, as the CLI does before exporting"""
+        from processor.vulnerability_processor import process_nessus_report
+
+        analysis_data = process_nessus_report(report)
+        analysis_data["report"] = report
+        return analysis_data
+
+    def _run_cli(self, *args):
+        """Run cli.main() in-process, returning (exit code, stdout)"""
+        import contextlib
+        import io
+        from unittest import mock
+
+        if REPO_ROOT not in sys.path:
+            sys.path.insert(0, REPO_ROOT)
+        import cli
+
+        stdout = io.StringIO()
+        exit_code = 0
+        with mock.patch.object(sys, "argv", ["cli.py", *args]):
+            with contextlib.redirect_stdout(stdout):
+                try:
+                    cli.main()
+                except SystemExit as e:
+                    exit_code = e.code or 0
+        return exit_code, stdout.getvalue()
+
     def test_nessus_parser_import(self):
         """Test that Nessus parser can be imported"""
         from parser.nessus_parser import NessusParser, parse_nessus_file  # noqa: F401
@@ -50,161 +136,103 @@ class TestVISSM(unittest.TestCase):
 
     def test_cli_help(self):
         """Test that CLI shows help"""
-        import subprocess
-
-        result = subprocess.run(
-            [
-                sys.executable,
-                os.path.join(os.path.dirname(__file__), "..", "cli.py"),
-                "--help",
-            ],
-            capture_output=True,
-            text=True,
-        )
+        exit_code, output = self._run_cli("--help")
 
-        self.assertEqual(result.returncode, 0)
-        self.assertIn("Virtual POAM Generator", result.stdout)
+        self.assertEqual(exit_code, 0)
+        self.assertIn("Virtual POAM Generator", output)
 
     def test_cli_version(self):
         """Test that CLI shows version"""
-        import subprocess
-
-        result = subprocess.run(
-            [
-                sys.executable,
-                os.path.join(os.path.dirname(__file__), "..", "cli.py"),
-                "--version",
-            ],
-            capture_output=True,
-            text=True,
-        )
+        exit_code, output = self._run_cli("--version")
 
-        self.assertEqual(result.returncode, 0)
-        self.assertIn("Virtual POAM Generator v1.0", result.stdout)
+        self.assertEqual(exit_code, 0)
+        self.assertIn("Virtual POAM Generator v1.0", output)
 
     def test_nessus_parser_structure(self):
         """Test Nessus parser data structures"""
-        from parser.nessus_parser import (
-            NessusReport,
-            ReportHost,
-            Vulnerability,
-            HostProperties,
-        )
-
         # Test data structure creation
-        props = HostProperties(
-            hostname="test-host",
-            ip="192.168.1.1",
-            os="Windows 10",
-            mac_address="",
-            netbios_name="",
-            fqdn="",
-            scan_start="",
-            scan_end="",
-        )
+        host = self._make_host([self._make_vulnerability()])
+        report = self._make_report([host])
 
-        vuln = Vulnerability(
-            plugin_id="12345",
-            plugin_name="Test Vulnerability",
-            plugin_family="Test Family",
-            severity=3,
-            description="Test description",
-            solution="Test solution",
-            see_also="",
-            cve="CVE-2023-1234",
-            cvss_base_score="7.5",
-            cvss_vector="",
-            port="80",
-            protocol="tcp",
-            service_name="http",
-            plugin_output="",
-        )
+        self.assertEqual(report.total_hosts, 1)
+        self.assertEqual(report.total_vulnerabilities, 1)
+        self.assertEqual(host.vulnerabilities[0].severity, 3)
 
-        host = ReportHost(name="192.168.1.1", properties=props, vulnerabilities=[vuln])
+    def test_nessus_parser_gzip(self):
+        """Test that gzipped .nessus files parse like plain ones"""
+        import gzip
+        from parser.nessus_parser import parse_nessus_file
+
+        xml = (
+            "<NessusClientData_v2>"
+            "<Policy><policyName>Test Policy</policyName></Policy>"
+            '<Report name="Test"><ReportHost name="192.168.1.1">'
+            '<HostProperties><tag name="hostname">test-host</tag></HostProperties>'
+            '<ReportItem pluginID="12345" pluginName="Test Vulnerability" '
+            'severity="3"><description>Test description</description>'
+            "</ReportItem></ReportHost></Report></NessusClientData_v2>"
+        ).encode("utf-8")
+
+        plain_path = self.test_output_dir / "scan.nessus"
+        plain_path.write_bytes(xml)
+        gz_path = self.test_output_dir / "scan.nessus.gz"
+        with gzip.open(gz_path, "wb") as f:
+            f.write(xml)
+
+        report = parse_nessus_file(str(gz_path))
+
+        self.assertEqual(report, parse_nessus_file(str(plain_path)))
+        self.assertEqual(report.policy_name, "Test Policy")
+        self.assertEqual(report.total_vulnerabilities, 1)
+        self.assertEqual(report.hosts[0].properties.hostname, "test-host")
 
-        report = NessusReport(
-            policy_name="Test Policy",
-            scan_name="Test Scan",
-            scan_start="2023-01-01",
-            scan_end="2023-01-01",
-            hosts=[host],
-            total_hosts=1,
-            total_vulnerabilities=1,
+    def test_nessus_parser_bad_cvss_score(self):
+        """Test that blank or malformed CVSS scores parse as 0.0"""
+        from parser.nessus_parser import parse_nessus_file
+
+        items = "".join(
+            f'<ReportItem pluginID="{plugin_id}" severity="2">'
+            f"<cvss_base_score>{score}</cvss_base_score></ReportItem>"
+            for plugin_id, score in (("1", " 7.5 "), ("2", "  "), ("3", "n/a"))
         )
+        xml = (
+            "<NessusClientData_v2>"
+            '<Report name="Test"><ReportHost name="192.168.1.1">'
+            f"{items}</ReportHost></Report></NessusClientData_v2>"
+        )
+        scan_path = self.test_output_dir / "scores.nessus"
+        scan_path.write_text(xml, encoding="utf-8")
 
-        self.assertEqual(report.total_hosts, 1)
-        self.assertEqual(report.total_vulnerabilities, 1)
-        self.assertEqual(host.vulnerabilities[0].severity, 3)
+        report = parse_nessus_file(str(scan_path))
+
+        scores = [vuln.cvss_base_score for vuln in report.hosts[0].vulnerabilities]
+        self.assertEqual(scores, [7.5, 0.0, 0.0])
 
     def test_vulnerability_processor_analysis(self):
         """Test vulnerability processor analysis"""
-        from parser.nessus_parser import (
-            NessusReport,
-            ReportHost,
-            Vulnerability,
-            HostProperties,
-        )
         from processor.vulnerability_processor import VulnerabilityProcessor
 
         # Create test data
-        props = HostProperties(
-            hostname="test-host",
-            ip="192.168.1.1",
-            os="Windows 10",
-            mac_address="",
-            netbios_name="",
-            fqdn="",
-            scan_start="",
-            scan_end="",
-        )
-
-        vuln1 = Vulnerability(
-            plugin_id="12345",
+        vuln1 = self._make_vulnerability(
             plugin_name="Critical Vulnerability",
             plugin_family="Critical Family",
             severity=4,  # Critical
             description="Critical test description",
             solution="Critical test solution",
-            see_also="",
-            cve="CVE-2023-1234",
-            cvss_base_score="9.5",
-            cvss_vector="",
-            port="80",
-            protocol="tcp",
-            service_name="http",
-            plugin_output="",
+            cvss_base_score=9.5,
         )
-
-        vuln2 = Vulnerability(
+        vuln2 = self._make_vulnerability(
             plugin_id="12346",
             plugin_name="High Vulnerability",
             plugin_family="High Family",
             severity=3,  # High
             description="High test description",
             solution="High test solution",
-            see_also="",
             cve="CVE-2023-1235",
-            cvss_base_score="7.5",
-            cvss_vector="",
             port="443",
-            protocol="tcp",
             service_name="https",
-            plugin_output="",
-        )
-
-        host = ReportHost(
-            name="192.168.1.1", properties=props, vulnerabilities=[vuln1, vuln2]
-        )
-
-        report = NessusReport(
-            policy_name="Test Policy",
-            scan_name="Test Scan",
-            scan_start="2023-01-01",
-            scan_end="2023-01-01",
-            hosts=[host],
-            total_hosts=1,
-            total_vulnerabilities=2,
         )
+        report = self._make_report([self._make_host([vuln1, vuln2])])
 
         # Process the data
         processor = VulnerabilityProcessor(report)
@@ -219,59 +247,18 @@ class TestVISSM(unittest.TestCase):
 
     def test_html_export(self):
         """Test HTML export functionality"""
-        from parser.nessus_parser import (
-            NessusReport,
-            ReportHost,
-            Vulnerability,
-            HostProperties,
-        )
-        from processor.vulnerability_processor import process_nessus_report
         from exporters.html_exporter import export_html_report
 
         # Create minimal test data
-        props = HostProperties(
-            hostname="test-host",
-            ip="192.168.1.1",
-            os="Windows 10",
-            mac_address="",
-            netbios_name="",
-            fqdn="",
-            scan_start="",
-            scan_end="",
-        )
-
-        vuln = Vulnerability(
-            plugin_id="12345",
-            plugin_name="Test Vulnerability",
-            plugin_family="Test Family",
+        vuln = self._make_vulnerability(
+            plugin_name="Test Vulnerability <script>",
             severity=2,
-            description="Test description",
-            solution="Test solution",
-            see_also="",
-            cve="CVE-2023-1234",
-            cvss_base_score="5.0",
-            cvss_vector="",
-            port="80",
-            protocol="tcp",
-            service_name="http",
-            plugin_output="",
-        )
-
-        host = ReportHost(name="192.168.1.1", properties=props, vulnerabilities=[vuln])
-
-        report = NessusReport(
-            policy_name="Test Policy",
-            scan_name="Test Scan",
-            scan_start="2023-01-01",
-            scan_end="2023-01-01",
-            hosts=[host],
-            total_hosts=1,
-            total_vulnerabilities=1,
+            cvss_base_score=5.0,
         )
+        report = self._make_report([self._make_host([vuln])])
 
         # Process and export
-        analysis_data = process_nessus_report(report)
-        analysis_data["report"] = report
+        analysis_data = self._make_analysis_data(report)
 
         output_file = self.test_output_dir / "test_report.html"
         result_path = export_html_report(analysis_data, str(output_file))
@@ -285,63 +272,44 @@ class TestVISSM(unittest.TestCase):
             content = f.read()
             self.assertIn("Vulnerability Assessment Report", content)
             self.assertIn("test-host", content)
-            self.assertIn("Test Vulnerability", content)
-
-    def test_csv_export(self):
-        """Test CSV export functionality"""
-        from parser.nessus_parser import (
-            NessusReport,
-            ReportHost,
-            Vulnerability,
-            HostProperties,
+            self.assertIn("Test Vulnerability &lt;script&gt;", content)
+            self.assertNotIn("<script>", content.split("</head>")[1])
+
+    def test_html_export_empty_fields(self):
+        """Test that empty scan elements render as placeholders in HTML"""
+        from parser.nessus_parser import parse_nessus_file
+        from templates.template_engine import render_html_report
+
+        xml = (
+            "<NessusClientData_v2>"
+            '<Report name="Test"><ReportHost name="192.168.1.1">'
+            "<HostProperties/>"
+            '<ReportItem pluginID="12345" pluginName="Test Vulnerability" '
+            'severity="3" port="80" protocol="tcp"><cve/><solution/>'
+            "</ReportItem></ReportHost></Report></NessusClientData_v2>"
         )
-        from processor.vulnerability_processor import process_nessus_report
-        from exporters.csv_exporter import export_csv_report
+        scan_path = self.test_output_dir / "empty.nessus"
+        scan_path.write_text(xml, encoding="utf-8")
 
-        # Create minimal test data
-        props = HostProperties(
-            hostname="test-host",
-            ip="192.168.1.1",
-            os="Windows 10",
-            mac_address="",
-            netbios_name="",
-            fqdn="",
-            scan_start="",
-            scan_end="",
-        )
+        report = parse_nessus_file(str(scan_path))
+        self.assertIsNone(report.hosts[0].vulnerabilities[0].cve)
 
-        vuln = Vulnerability(
-            plugin_id="12345",
-            plugin_name="Test Vulnerability",
-            plugin_family="Test Family",
-            severity=2,
-            description="Test description",
-            solution="Test solution",
-            see_also="",
-            cve="CVE-2023-1234",
-            cvss_base_score="5.0",
-            cvss_vector="",
-            port="80",
-            protocol="tcp",
-            service_name="http",
-            plugin_output="",
-        )
+        content = render_html_report(self._make_analysis_data(report))
 
-        host = ReportHost(name="192.168.1.1", properties=props, vulnerabilities=[vuln])
+        self.assertIn("<td>80/tcp</td>\n            <td>N/A</td>", content)
 
-        report = NessusReport(
-            policy_name="Test Policy",
-            scan_name="Test Scan",
-            scan_start="2023-01-01",
-            scan_end="2023-01-01",
-            hosts=[host],
-            total_hosts=1,
-            total_vulnerabilities=1,
-        )
+    def test_csv_export(self):
+        """Test CSV export functionality"""
+        import csv
+        import io
+        from exporters.csv_exporter import CSVExporter, export_csv_report
+
+        # Create minimal test data
+        vuln = self._make_vulnerability(severity=2, cvss_base_score=5.0)
+        report = self._make_report([self._make_host([vuln])])
 
         # Process and export
-        analysis_data = process_nessus_report(report)
-        analysis_data["report"] = report
+        analysis_data = self._make_analysis_data(report)
 
         output_file = self.test_output_dir / "test_report.csv"
         result_path = export_csv_report(analysis_data, str(output_file))
@@ -357,6 +325,45 @@ class TestVISSM(unittest.TestCase):
             self.assertIn("test-host", content)
             self.assertIn("12345", content)
 
+        # The string export matches each summary to its host the same way
+        csv_string = CSVExporter().export_to_string(analysis_data)
+        self.assertIn("test-host,192.168.1.1,Windows 10,12345", csv_string)
+
+        # A host named by two summaries is listed once in both exports
+        analysis_data["host_summaries"].append(analysis_data["host_summaries"][0])
+        export_csv_report(analysis_data, str(output_file))
+        with open(output_file, "r", newline="", encoding="utf-8") as f:
+            file_rows = [row[:5] for row in csv.reader(f)]
+        csv_string = CSVExporter().export_to_string(analysis_data)
+        string_rows = [row[:5] for row in csv.reader(io.StringIO(csv_string))]
+
+        self.assertEqual(file_rows, string_rows)
+        self.assertEqual(len(file_rows), 2)
+
+    def test_excel_export_all(self):
+        """Test that export_all writes every Excel report"""
+        from exporters.excel_exporter import ExcelExporter, export_all
+
+        report = self._make_report([self._make_host([self._make_vulnerability()])])
+        analysis_data = self._make_analysis_data(report)
+
+        paths = export_all(analysis_data, str(self.test_output_dir / "excel"))
+
+        self.assertEqual(len(paths), 6)
+        for path in paths.values():
+            self.assertTrue(os.path.exists(path))
+            self.assertGreater(os.path.getsize(path), 0)
+
+        # The method behind it returns the same report names
+        exporter_paths = ExcelExporter().export_all(
+            analysis_data, str(self.test_output_dir / "excel_method")
+        )
+
+        self.assertEqual(exporter_paths.keys(), paths.keys())
+        for path in exporter_paths.values():
+            self.assertTrue(os.path.exists(path))
+            self.assertGreater(os.path.getsize(path), 0)
+
     def tearDown(self):
         """Clean up test environment"""
         import shutil